@@ -7,12 +7,9 @@ dental implant preload with improved accuracy.
 """
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import plotly.express as px
-import plotly.graph_objects as go
-import json
+import orjson
+import hashlib
+import hmac
 import math
 import io
 import base64
@@ -23,13 +20,18 @@ from datetime import datetime
 from components.welcome import show_welcome
 from components.preload_calculator import show_preload_calculator
 from components.final_torque_calculator import show_final_torque_calculator
-from components.compare_methods import show_compare_methods
+from components import show_compare_methods, generate_pdf_report
 from components.implant_systems_analysis import show_implant_systems_analysis
-from components.generate_report import generate_pdf_report
+
+# Project paths, resolved once at import
+_APP_ROOT = Path(__file__).resolve().parent.parent
+_ENHANCED_JSON = _APP_ROOT / "data" / "implant_systems" / "enhanced_systems.json"
+_SAMPLE_JSON = _APP_ROOT / "data" / "implant_systems" / "sample_systems.json"
 
 # Import core calculation modules
 import sys
-sys.path.append(str(Path(__file__).parent.parent))
+if str(_APP_ROOT) not in sys.path:
+    sys.path.append(str(_APP_ROOT))
 from src.core.preload import (
     calculate_preload,
     calculate_final_torque,
@@ -46,16 +48,8 @@ from src.core.torque import (
     assess_risk
 )
 
-# Set page configuration
-st.set_page_config(
-    page_title="Dental Implant Preload Calculator",
-    page_icon="🦷",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# App title and styling
-st.markdown("""
+# Global page styles
+_MAIN_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -83,16 +77,51 @@ st.markdown("""
         margin-top: 3rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Set page configuration
+st.set_page_config(
+    page_title="Dental Implant Preload Calculator",
+    page_icon="🦷",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# App title and styling
+st.markdown(_MAIN_CSS, unsafe_allow_html=True)
+
+# SHA-256 digest of the access password
+_PW_HASH = bytes.fromhex("bb842459fa30ec72f667b5494b7ade468a7a163265c9524a2e5f151483450f91")
+
+# Minimal dataset used when the implant database cannot be loaded
+_FALLBACK_IMPLANT_DATA = {
+    "metadata": {"version": "1.0.0"},
+    "implant_systems": {
+        "Generic": {
+            "Standard": {
+                "connection_type": "Generic",
+                "screws": {
+                    "standard": {
+                        "diameter": 2.0,
+                        "thread_pitch": 0.4,
+                        "material": "Titanium Alloy",
+                        "yield_strength": 950,
+                        "K_factor": 0.2,
+                        "recommended_torque": 35
+                    }
+                }
+            }
+        }
+    }
+}
 
 # Function to load implant systems data
-# Temporarily removing cache decorator for testing
-# @st.cache_data
+@st.cache_data
 def load_implant_data():
     """Load implant systems data from JSON file."""
     # Try to load the enhanced database first, fall back to sample database if not available
-    enhanced_path = Path(__file__).parent.parent / "data" / "implant_systems" / "enhanced_systems.json"
-    sample_path = Path(__file__).parent.parent / "data" / "implant_systems" / "sample_systems.json"
+    enhanced_path = _ENHANCED_JSON
+    sample_path = _SAMPLE_JSON
     
     print(f"Enhanced path exists: {enhanced_path.exists()}")
     print(f"Sample path exists: {sample_path.exists()}")
@@ -100,45 +129,79 @@ def load_implant_data():
     try:
         if enhanced_path.exists():
             print("Loading enhanced database")
-            with open(enhanced_path, 'r') as f:
-                data = json.load(f)
-                print(f"Enhanced systems: {list(data['implant_systems'].keys())}")
-                return data
+            data = orjson.loads(enhanced_path.read_bytes())
+            print(f"Enhanced systems: {list(data['implant_systems'].keys())}")
+            return data
         else:
             print("Loading sample database")
-            with open(sample_path, 'r') as f:
-                data = json.load(f)
-                print(f"Sample systems: {list(data['implant_systems'].keys())}")
-                return data
+            data = orjson.loads(sample_path.read_bytes())
+            print(f"Sample systems: {list(data['implant_systems'].keys())}")
+            return data
     except Exception as e:
         st.error(f"Error loading implant data: {e}")
         print(f"Error loading implant data: {e}")
         # Return a minimal dataset if loading fails
-        return {
-            "metadata": {"version": "1.0.0"},
-            "implant_systems": {
-                "Generic": {
-                    "Standard": {
-                        "connection_type": "Generic",
-                        "screws": {
-                            "standard": {
-                                "diameter": 2.0,
-                                "thread_pitch": 0.4,
-                                "material": "Titanium Alloy",
-                                "yield_strength": 950,
-                                "K_factor": 0.2,
-                                "recommended_torque": 35
-                            }
-                        }
-                    }
-                }
-            }
-        }
+        return _FALLBACK_IMPLANT_DATA
+
+# Function to flatten the nested implant database into a lookup table
+@st.cache_data
+def build_implant_frame(implant_data):
+    """Flatten implant systems data into a DataFrame indexed by (system, model)."""
+    import pandas as pd
+    
+    records = []
+    for system_name, system_data in implant_data["implant_systems"].items():
+        for model_name, model_data in system_data.items():
+            screw_data = model_data["screws"]["standard"]
+            records.append((
+                system_name,
+                model_name,
+                model_data["connection_type"],
+                screw_data["material"],
+                screw_data["diameter"],  # mm
+                screw_data["thread_pitch"],  # mm
+                screw_data["K_factor"],
+                screw_data["yield_strength"],  # MPa
+                screw_data["recommended_torque"]  # N-cm
+            ))
+    
+    df = pd.DataFrame.from_records(records, columns=[
+        "system", "model", "connection_type", "material", "diameter", "thread_pitch",
+        "k_factor", "yield_strength", "recommended_torque"
+    ]).astype({
+        "diameter": "float64",
+        "thread_pitch": "float64",
+        "k_factor": "float64",
+        "yield_strength": "float64",
+        "recommended_torque": "float64"
+    })
+    df["diameter_cm"] = df["diameter"] / 10
+    df["thread_pitch_cm"] = df["thread_pitch"] / 10
+    
+    return df.set_index(["system", "model"])
 
 # Initialize session state
 if 'implant_data' not in st.session_state:
     st.session_state.implant_data = load_implant_data()
 
+if 'implant_df' not in st.session_state:
+    st.session_state.implant_df = build_implant_frame(st.session_state.implant_data)
+
+# System and model names for the selectboxes
+if 'system_names' not in st.session_state:
+    st.session_state.system_names = tuple(st.session_state.implant_data["implant_systems"])
+    st.session_state.model_names_by_system = {
+        system: tuple(models) for system, models in st.session_state.implant_data["implant_systems"].items()
+    }
+    
+    # Display names for the selectboxes and cards (underscores shown as spaces)
+    st.session_state.display_names = {
+        name: name.replace("_", " ")
+        for name in st.session_state.system_names + tuple(
+            model for models in st.session_state.model_names_by_system.values() for model in models
+        )
+    }
+
 if 'page' not in st.session_state:
     st.session_state.page = 'welcome'
 
@@ -158,7 +221,7 @@ with st.sidebar:
         st.subheader("Authentication Required")
         password = st.text_input("Enter access password", type="password")
         if st.button("Login"):
-            if password == "chandur2025":
+            if hmac.compare_digest(hashlib.sha256(password.encode("utf-8")).digest(), _PW_HASH):
                 st.session_state.authenticated = True
                 st.success("Login successful!")
                 st.rerun()
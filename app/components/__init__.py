@@ -9,6 +9,16 @@ This package contains the UI components for the Streamlit application.
 from .welcome import show_welcome
 from .preload_calculator import show_preload_calculator
 from .final_torque_calculator import show_final_torque_calculator
-from .compare_methods import show_compare_methods
 from .implant_systems_analysis import show_implant_systems_analysis
-from .generate_report import generate_pdf_report 
\ No newline at end of file
+
+
+def show_compare_methods():
+    """Display the compare methods page, importing its module on first use."""
+    from .compare_methods import show_compare_methods as _show_compare_methods
+    return _show_compare_methods()
+
+
+def generate_pdf_report(calculation_results):
+    """Generate the PDF report, importing ReportLab on first use."""
+    from .generate_report import generate_pdf_report as _generate_pdf_report
+    return _generate_pdf_report(calculation_results)
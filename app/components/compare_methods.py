@@ -7,30 +7,241 @@ and conventional preload calculation methods.
 """
 
 import streamlit as st
-import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
 import math
-import json
+import string
 from pathlib import Path
 
 # Import calculation functions
 import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
+_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.append(str(_ROOT))
 from src.core.preload import (
     calculate_preload,
+    calculate_preload_batch,
     estimate_uncertainty,
     calculate_preload_range
 )
 from src.core.torque import (
     estimate_preload_from_torque,
+    estimate_preload_from_torque_batch,
     calculate_stress_from_preload,
+    calculate_stress_from_preload_batch,
     calculate_safety_factor,
+    calculate_safety_factor_batch,
     calculate_tensile_area,
+    calculate_tensile_area_batch,
     assess_risk
 )
 
+# Static introduction shown at the top of the page
+_INTRO_HTML = """
+<div style="background-color: #1e2a38; color: white; padding: 1.5rem; border-radius: 8px; margin: 1rem 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+    <p style="font-size: 1.05rem; line-height: 1.6; margin: 0;">This component demonstrates the advantages of the Wadhwani-Hess method over conventional
+    methods for preload calculation. The key difference is improved accuracy with reduced
+    uncertainty (±9% vs. ±35%).</p>
+</div>
+"""
+
+# Information card for the selected implant system
+_SYSTEM_INFO_TEMPLATE = string.Template("""
+<div style="background-color: #ffffff; color: #333333; padding: 1.5rem; border-radius: 8px; margin: 1rem 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+    <h4 style="color: #2c3e50; margin-bottom: 15px;">$system $model</h4>
+    <ul style="font-size: 1.05rem; line-height: 1.5; color: #333333;">
+        <li>Connection Type: $connection_type</li>
+        <li>Screw Material: $material</li>
+        <li>Recommended Torque: $recommended_torque N-cm</li>
+        <li>Screw Diameter: $diameter mm</li>
+        <li>Thread Pitch: $thread_pitch mm</li>
+        <li>K-Factor: $k_factor</li>
+    </ul>
+</div>
+""")
+
+# Removal torque assumed for database systems (85% of tightening torque)
+REMOVAL_TORQUE_FACTOR = 0.85
+
+
+def compare_all_systems(implant_df):
+    """
+    Compare both preload methods for every implant system in one pass.
+    
+    Args:
+        implant_df (pd.DataFrame): Flattened implant table indexed by (system, model)
+        
+    Returns:
+        pd.DataFrame: Preload, stress and safety factor columns for both
+        methods, with the same index as implant_df
+    """
+    import pandas as pd
+    
+    torque = implant_df["recommended_torque"].to_numpy()
+    yield_strength = implant_df["yield_strength"].to_numpy()
+    
+    conv_preload = estimate_preload_from_torque_batch(
+        torque, implant_df["diameter_cm"].to_numpy(), implant_df["k_factor"].to_numpy()
+    )
+    wh_preload = calculate_preload_batch(
+        torque, torque * REMOVAL_TORQUE_FACTOR, implant_df["thread_pitch_cm"].to_numpy()
+    )
+    tensile_area = calculate_tensile_area_batch(
+        implant_df["diameter"].to_numpy(), implant_df["thread_pitch"].to_numpy()
+    )
+    conv_stress = calculate_stress_from_preload_batch(conv_preload, tensile_area)
+    wh_stress = calculate_stress_from_preload_batch(wh_preload, tensile_area)
+    
+    return pd.DataFrame({
+        "conv_preload": conv_preload,
+        "wh_preload": wh_preload,
+        "tensile_area": tensile_area,
+        "conv_stress": conv_stress,
+        "wh_stress": wh_stress,
+        "conv_safety": calculate_safety_factor_batch(conv_stress, yield_strength),
+        "wh_safety": calculate_safety_factor_batch(wh_stress, yield_strength)
+    }, index=implant_df.index)
+
+
+@st.cache_data
+def _build_comparison_table(
+    conv_preload, wh_preload,
+    conv_uncertainty, wh_uncertainty,
+    conv_min, conv_max,
+    wh_min, wh_max,
+    conv_stress, wh_stress,
+    conv_safety, wh_safety,
+    conv_risk, wh_risk
+):
+    """Build the comparison table for both methods (cached on the inputs)."""
+    import pandas as pd
+    
+    # Numeric columns stay numeric; formatting is applied when displayed
+    return pd.DataFrame({
+        "Method": ["Conventional", "Wadhwani-Hess"],
+        "Preload (N)": np.array([conv_preload, wh_preload], dtype=np.float64),
+        "Uncertainty": np.array([conv_uncertainty, wh_uncertainty], dtype=np.float64),
+        "Preload Range (N)": [
+            f"{conv_min:.2f} - {conv_max:.2f}",
+            f"{wh_min:.2f} - {wh_max:.2f}"
+        ],
+        "Stress (MPa)": np.array([conv_stress, wh_stress], dtype=np.float64),
+        "Safety Factor": np.array([conv_safety, wh_safety], dtype=np.float64),
+        "Risk Level": [conv_risk, wh_risk]
+    })
+
+
+@st.cache_data
+def _build_comparison_fig(conv_preload, conv_min, conv_max, wh_preload, wh_min, wh_max):
+    """Build the preload range bar chart for both methods (cached on the inputs)."""
+    # Plain figure dict: st.plotly_chart accepts it without building graph objects
+    conv_bar = {
+        "type": "bar",
+        "name": "Conventional Method",
+        "x": ["Conventional"],
+        "y": [conv_preload],
+        "error_y": {
+            "type": "data",
+            "symmetric": False,
+            "array": [conv_max - conv_preload],
+            "arrayminus": [conv_preload - conv_min],
+            "color": "rgba(31, 119, 180, 0.6)"
+        },
+        "marker": {"color": "rgba(31, 119, 180, 0.6)"}
+    }
+    
+    wh_bar = {
+        "type": "bar",
+        "name": "Wadhwani-Hess Method",
+        "x": ["Wadhwani-Hess"],
+        "y": [wh_preload],
+        "error_y": {
+            "type": "data",
+            "symmetric": False,
+            "array": [wh_max - wh_preload],
+            "arrayminus": [wh_preload - wh_min],
+            "color": "rgba(255, 127, 14, 0.6)"
+        },
+        "marker": {"color": "rgba(255, 127, 14, 0.6)"}
+    }
+    
+    return {
+        "data": [conv_bar, wh_bar],
+        "layout": {
+            "title": {"text": "Preload Range Comparison"},
+            "yaxis": {"title": {"text": "Preload (N)"}},
+            "barmode": "group",
+            "height": 400
+        }
+    }
+
+
+def _render_comparison(results):
+    """Display the comparison table, messages and chart for a stored comparison."""
+    # Display the comparison table
+    st.markdown("""
+    <h4>Preload Calculation Comparison</h4>
+    """, unsafe_allow_html=True)
+    
+    df = _build_comparison_table(
+        results['conventional_preload'], results['wh_preload'],
+        results['conv_uncertainty'], results['wh_uncertainty'],
+        results['conv_min_preload'], results['conv_max_preload'],
+        results['wh_min_preload'], results['wh_max_preload'],
+        results['conv_stress'], results['wh_stress'],
+        results['conv_safety'], results['wh_safety'],
+        results['conv_risk'], results['wh_risk']
+    )
+    st.dataframe(
+        df.style.format({
+            "Preload (N)": "{:.2f}",
+            "Uncertainty": "±{:g}%",
+            "Stress (MPa)": "{:.2f}",
+            "Safety Factor": "{:.2f}"
+        }),
+        hide_index=True,
+        use_container_width=True
+    )
+    
+    if results['in_conventional_range']:
+        st.success("✅ Wadhwani-Hess preload is within the conventional method's uncertainty range.")
+    else:
+        st.warning("⚠️ Wadhwani-Hess preload is outside the conventional method's uncertainty range.")
+    
+    st.info(f"📊 The Wadhwani-Hess method reduces uncertainty by {results['uncertainty_reduction']:.1f}%")
+    
+    # Risk assessment
+    if results['wh_risk'] != results['conv_risk']:
+        st.warning(f"""
+        ⚠️ Risk level assessment differs between methods:
+        - Conventional: {results['conv_risk']} risk
+        - Wadhwani-Hess: {results['wh_risk']} risk
+        """)
+    
+    # Visualization - Preload Range Comparison
+    fig = _build_comparison_fig(
+        results['conventional_preload'], results['conv_min_preload'], results['conv_max_preload'],
+        results['wh_preload'], results['wh_min_preload'], results['wh_max_preload']
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Formula details
+    with st.expander("See Calculation Details"):
+        st.markdown(f"""
+        <h4>Conventional Method:</h4>
+        <p>P = T / (K × d)</p>
+        <p>P = {results['torque']} / ({results['k_factor']} × {results['diameter']})</p>
+        <p>P = {results['torque']} / {results['k_factor'] * results['diameter']:.4f}</p>
+        <p>P = {results['conventional_preload']:.2f} N</p>
+    
+        <h4>Wadhwani-Hess Method:</h4>
+        <p>P = (T<sub>t</sub> - T<sub>r</sub>) × π / p</p>
+        <p>P = ({results['torque']} - {results['removal_torque']}) × π / {results['thread_pitch']}</p>
+        <p>P = {results['torque'] - results['removal_torque']} × {math.pi:.4f} / {results['thread_pitch']}</p>
+        <p>P = {((results['torque'] - results['removal_torque']) * math.pi):.4f} / {results['thread_pitch']}</p>
+        <p>P = {results['wh_preload']:.2f} N</p>
+        """, unsafe_allow_html=True)
+
 
 def show_compare_methods():
     """Display a comparison between calculation methods."""
@@ -39,13 +250,7 @@ def show_compare_methods():
     
     # Main container
     with st.container():
-        st.markdown("""
-        <div style="background-color: #1e2a38; color: white; padding: 1.5rem; border-radius: 8px; margin: 1rem 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <p style="font-size: 1.05rem; line-height: 1.6; margin: 0;">This component demonstrates the advantages of the Wadhwani-Hess method over conventional
-            methods for preload calculation. The key difference is improved accuracy with reduced
-            uncertainty (±9% vs. ±35%).</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_INTRO_HTML, unsafe_allow_html=True)
         
         # Input method selection
         input_method = st.radio(
@@ -61,52 +266,51 @@ def show_compare_methods():
             st.subheader("Input Parameters")
             
             if input_method == "Select from Implant System Database":
-                # Get implant systems data
-                implant_data = st.session_state.implant_data
+                # Get flattened implant systems table
+                implant_df = st.session_state.implant_df
                 
                 # System selection
-                system_names = list(implant_data["implant_systems"].keys())
+                system_names = st.session_state.system_names
                 selected_system = st.selectbox(
                     "Select Implant System",
                     system_names,
-                    format_func=lambda x: x.replace("_", " ")
+                    format_func=st.session_state.display_names.__getitem__
                 )
                 
                 # Model selection
-                model_names = list(implant_data["implant_systems"][selected_system].keys())
+                model_names = st.session_state.model_names_by_system[selected_system]
                 selected_model = st.selectbox(
                     "Select Model",
                     model_names,
-                    format_func=lambda x: x.replace("_", " ")
+                    format_func=st.session_state.display_names.__getitem__
                 )
                 
                 # Get screw data
-                screw_data = implant_data["implant_systems"][selected_system][selected_model]["screws"]["standard"]
+                screw_data = implant_df.loc[(selected_system, selected_model)]
                 
                 # Display information about the selected system
-                st.markdown(f"""
-                <div style="background-color: #ffffff; color: #333333; padding: 1.5rem; border-radius: 8px; margin: 1rem 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-                    <h4 style="color: #2c3e50; margin-bottom: 15px;">{selected_system.replace('_', ' ')} {selected_model}</h4>
-                    <ul style="font-size: 1.05rem; line-height: 1.5; color: #333333;">
-                        <li>Connection Type: {implant_data["implant_systems"][selected_system][selected_model]["connection_type"]}</li>
-                        <li>Screw Material: {screw_data["material"]}</li>
-                        <li>Recommended Torque: {screw_data["recommended_torque"]} N-cm</li>
-                        <li>Screw Diameter: {screw_data["diameter"]} mm</li>
-                        <li>Thread Pitch: {screw_data["thread_pitch"]} mm</li>
-                        <li>K-Factor: {screw_data["K_factor"]}</li>
-                    </ul>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_SYSTEM_INFO_TEMPLATE.substitute(
+                    system=st.session_state.display_names[selected_system],
+                    model=selected_model,
+                    connection_type=screw_data["connection_type"],
+                    material=screw_data["material"],
+                    recommended_torque=f"{screw_data['recommended_torque']:g}",
+                    diameter=f"{screw_data['diameter']:g}",
+                    thread_pitch=f"{screw_data['thread_pitch']:g}",
+                    k_factor=f"{screw_data['k_factor']:g}"
+                ), unsafe_allow_html=True)
                 
                 # Default values from database
                 torque = float(screw_data["recommended_torque"])
-                diameter = float(screw_data["diameter"]) / 10  # mm to cm
-                thread_pitch = float(screw_data["thread_pitch"]) / 10  # mm to cm
-                k_factor = float(screw_data["K_factor"])
-                removal_torque = torque * 0.85  # Default estimate
+                diameter = float(screw_data["diameter_cm"])
+                thread_pitch = float(screw_data["thread_pitch_cm"])
+                k_factor = float(screw_data["k_factor"])
+                removal_torque = torque * REMOVAL_TORQUE_FACTOR  # Default estimate
                 yield_strength = float(screw_data["yield_strength"])
             
             else:  # Manual Entry
+                selected_system = selected_model = None
+                
                 # Default values for manual entry
                 torque = st.number_input(
                     "Tightening Torque (N-cm)",
@@ -116,21 +320,23 @@ def show_compare_methods():
                     step=0.1
                 )
                 
-                diameter = st.number_input(
+                diameter_mm = st.number_input(
                     "Screw Diameter (mm)",
                     min_value=0.5,
                     max_value=5.0,
                     value=2.0,
                     step=0.1
-                ) / 10  # Convert to cm
+                )
+                diameter = diameter_mm / 10  # Convert to cm
                 
-                thread_pitch = st.number_input(
+                thread_pitch_mm = st.number_input(
                     "Thread Pitch (mm)",
                     min_value=0.1,
                     max_value=1.0,
                     value=0.4,
                     step=0.05
-                ) / 10  # Convert to cm
+                )
+                thread_pitch = thread_pitch_mm / 10  # Convert to cm
                 
                 k_factor = st.number_input(
                     "K-Factor",
@@ -168,176 +374,108 @@ def show_compare_methods():
                 # Store calculation type
                 st.session_state.last_calculation = 'compare'
                 
-                # Calculate preload using conventional method
-                conventional_preload = estimate_preload_from_torque(torque, diameter, k_factor)
-                
-                # Get uncertainty for conventional method
-                conv_uncertainty, _ = estimate_uncertainty(torque, False)
-                
-                # Calculate preload range for conventional method
-                conv_min_preload, conv_max_preload = calculate_preload_range(
-                    conventional_preload, 
-                    conv_uncertainty
-                )
-                
-                # Calculate preload using Wadhwani-Hess method
-                wh_preload = calculate_preload(torque, removal_torque, thread_pitch)
-                
-                # Uncertainty for Wadhwani-Hess method (9% as per the paper)
-                wh_uncertainty = 9
-                
-                # Calculate preload range for Wadhwani-Hess method
-                wh_min_preload, wh_max_preload = calculate_preload_range(
-                    wh_preload, 
-                    wh_uncertainty
+                # Only recompute when the inputs have changed since the last comparison
+                input_key = (
+                    input_method, selected_system, selected_model,
+                    torque, removal_torque, diameter, thread_pitch, k_factor, yield_strength
                 )
-                
-                # Calculate tensile area and stress
-                tensile_area = calculate_tensile_area(diameter * 10, thread_pitch * 10)  # Convert back to mm
-                
-                # Calculate stress for both methods
-                conv_stress = calculate_stress_from_preload(conventional_preload, tensile_area)
-                wh_stress = calculate_stress_from_preload(wh_preload, tensile_area)
-                
-                # Calculate safety factors
-                conv_safety = calculate_safety_factor(conv_stress, yield_strength)
-                wh_safety = calculate_safety_factor(wh_stress, yield_strength)
-                
-                # Assess risk for both methods
-                conv_risk, conv_recommendation = assess_risk(conv_safety)
-                wh_risk, wh_recommendation = assess_risk(wh_safety)
-                
-                # Create a comparison table
-                comp_data = {
-                    "Method": ["Conventional", "Wadhwani-Hess"],
-                    "Preload (N)": [f"{conventional_preload:.2f}", f"{wh_preload:.2f}"],
-                    "Uncertainty": [f"±{conv_uncertainty}%", f"±{wh_uncertainty}%"],
-                    "Preload Range (N)": [
-                        f"{conv_min_preload:.2f} - {conv_max_preload:.2f}",
-                        f"{wh_min_preload:.2f} - {wh_max_preload:.2f}"
-                    ],
-                    "Stress (MPa)": [f"{conv_stress:.2f}", f"{wh_stress:.2f}"],
-                    "Safety Factor": [f"{conv_safety:.2f}", f"{wh_safety:.2f}"],
-                    "Risk Level": [conv_risk, wh_risk]
-                }
-                
-                # Display the comparison table
-                st.markdown("""
-                <h4>Preload Calculation Comparison</h4>
-                """, unsafe_allow_html=True)
-                
-                df = pd.DataFrame(comp_data)
-                st.dataframe(df, hide_index=True, use_container_width=True)
-                
-                # Check if WH preload is within conventional range
-                in_conventional_range = conv_min_preload <= wh_preload <= conv_max_preload
-                
-                if in_conventional_range:
-                    st.success("✅ Wadhwani-Hess preload is within the conventional method's uncertainty range.")
-                else:
-                    st.warning("⚠️ Wadhwani-Hess preload is outside the conventional method's uncertainty range.")
-                
-                # Calculate uncertainty reduction
-                uncertainty_reduction = (conv_uncertainty - wh_uncertainty) / conv_uncertainty * 100
-                
-                # Calculate preload percentage difference (WH compared to conventional)
-                preload_difference = ((wh_preload - conventional_preload) / conventional_preload) * 100
-                
-                st.info(f"📊 The Wadhwani-Hess method reduces uncertainty by {uncertainty_reduction:.1f}%")
-                
-                # Risk assessment
-                if wh_risk != conv_risk:
-                    st.warning(f"""
-                    ⚠️ Risk level assessment differs between methods:
-                    - Conventional: {conv_risk} risk
-                    - Wadhwani-Hess: {wh_risk} risk
-                    """)
-                
-                # Visualization - Preload Range Comparison
-                fig = go.Figure()
-                
-                # Add conventional method range
-                fig.add_trace(go.Bar(
-                    name="Conventional Method",
-                    x=["Conventional"],
-                    y=[conventional_preload],
-                    error_y=dict(
-                        type='data',
-                        symmetric=False,
-                        array=[conv_max_preload - conventional_preload],
-                        arrayminus=[conventional_preload - conv_min_preload],
-                        color="rgba(31, 119, 180, 0.6)"
-                    ),
-                    marker_color="rgba(31, 119, 180, 0.6)"
-                ))
-                
-                # Add Wadhwani-Hess method range
-                fig.add_trace(go.Bar(
-                    name="Wadhwani-Hess Method",
-                    x=["Wadhwani-Hess"],
-                    y=[wh_preload],
-                    error_y=dict(
-                        type='data',
-                        symmetric=False,
-                        array=[wh_max_preload - wh_preload],
-                        arrayminus=[wh_preload - wh_min_preload],
-                        color="rgba(255, 127, 14, 0.6)"
-                    ),
-                    marker_color="rgba(255, 127, 14, 0.6)"
-                ))
-                
-                fig.update_layout(
-                    title="Preload Range Comparison",
-                    yaxis_title="Preload (N)",
-                    barmode='group',
-                    height=400
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Formula details
-                with st.expander("See Calculation Details"):
-                    st.markdown(f"""
-                    <h4>Conventional Method:</h4>
-                    <p>P = T / (K × d)</p>
-                    <p>P = {torque} / ({k_factor} × {diameter})</p>
-                    <p>P = {torque} / {k_factor * diameter:.4f}</p>
-                    <p>P = {conventional_preload:.2f} N</p>
+                if (
+                    calculate_pressed
+                    or st.session_state.get('compare_input_key') != input_key
+                    or 'compare' not in st.session_state.calculation_results
+                ):
+                    if input_method == "Select from Implant System Database":
+                        # Every system is compared at once; read the selected row
+                        if 'implant_comparison' not in st.session_state:
+                            st.session_state.implant_comparison = compare_all_systems(
+                                st.session_state.implant_df
+                            )
+                        comparison = st.session_state.implant_comparison.loc[(selected_system, selected_model)]
                     
-                    <h4>Wadhwani-Hess Method:</h4>
-                    <p>P = (T<sub>t</sub> - T<sub>r</sub>) × π / p</p>
-                    <p>P = ({torque} - {removal_torque}) × π / {thread_pitch}</p>
-                    <p>P = {torque - removal_torque} × {math.pi:.4f} / {thread_pitch}</p>
-                    <p>P = {((torque - removal_torque) * math.pi):.4f} / {thread_pitch}</p>
-                    <p>P = {wh_preload:.2f} N</p>
-                    """, unsafe_allow_html=True)
-                
-                # Store results in session state for reporting
-                st.session_state.calculation_results['compare'] = {
-                    'torque': torque,
-                    'removal_torque': removal_torque,
-                    'diameter': diameter,
-                    'thread_pitch': thread_pitch,
-                    'k_factor': k_factor,
-                    'conventional_preload': conventional_preload,
-                    'wh_preload': wh_preload,
-                    'conv_uncertainty': conv_uncertainty,
-                    'wh_uncertainty': wh_uncertainty,
-                    'conv_min_preload': conv_min_preload,
-                    'conv_max_preload': conv_max_preload,
-                    'wh_min_preload': wh_min_preload,
-                    'wh_max_preload': wh_max_preload,
-                    'uncertainty_reduction': uncertainty_reduction,
-                    'preload_difference': preload_difference,
-                    'conv_stress': conv_stress,
-                    'wh_stress': wh_stress,
-                    'conv_safety': conv_safety,
-                    'wh_safety': wh_safety,
-                    'conv_risk': conv_risk,
-                    'wh_risk': wh_risk,
-                    'in_conventional_range': in_conventional_range
-                }
+                        conventional_preload = float(comparison["conv_preload"])
+                        wh_preload = float(comparison["wh_preload"])
+                        tensile_area = float(comparison["tensile_area"])
+                        conv_stress = float(comparison["conv_stress"])
+                        wh_stress = float(comparison["wh_stress"])
+                        conv_safety = float(comparison["conv_safety"])
+                        wh_safety = float(comparison["wh_safety"])
+                    else:
+                        # Calculate preload using both methods
+                        conventional_preload = estimate_preload_from_torque(torque, diameter, k_factor)
+                        wh_preload = calculate_preload(torque, removal_torque, thread_pitch)
+                    
+                        # Calculate tensile area and stress
+                        tensile_area = calculate_tensile_area(diameter_mm, thread_pitch_mm)
+                    
+                        # Calculate stress for both methods
+                        conv_stress = calculate_stress_from_preload(conventional_preload, tensile_area)
+                        wh_stress = calculate_stress_from_preload(wh_preload, tensile_area)
+                    
+                        # Calculate safety factors
+                        conv_safety = calculate_safety_factor(conv_stress, yield_strength)
+                        wh_safety = calculate_safety_factor(wh_stress, yield_strength)
+                    
+                    # Get uncertainty for conventional method
+                    conv_uncertainty, _ = estimate_uncertainty(round(torque, 4), False)
+                    
+                    # Calculate preload range for conventional method
+                    conv_min_preload, conv_max_preload = calculate_preload_range(
+                        conventional_preload, 
+                        conv_uncertainty
+                    )
+                    
+                    # Uncertainty for Wadhwani-Hess method (9% as per the paper)
+                    wh_uncertainty = 9
+                    
+                    # Calculate preload range for Wadhwani-Hess method
+                    wh_min_preload, wh_max_preload = calculate_preload_range(
+                        wh_preload, 
+                        wh_uncertainty
+                    )
+                    
+                    # Assess risk for both methods
+                    conv_risk, conv_recommendation = assess_risk(conv_safety)
+                    wh_risk, wh_recommendation = assess_risk(wh_safety)
+                    
+                    # Check if WH preload is within conventional range
+                    in_conventional_range = conv_min_preload <= wh_preload <= conv_max_preload
+                    
+                    # Calculate uncertainty reduction
+                    uncertainty_reduction = (conv_uncertainty - wh_uncertainty) / conv_uncertainty * 100
+                    
+                    # Calculate preload percentage difference (WH compared to conventional)
+                    preload_difference = ((wh_preload - conventional_preload) / conventional_preload) * 100
+                    
+                    # Store results in session state for reporting
+                    st.session_state.calculation_results['compare'] = {
+                        'torque': torque,
+                        'removal_torque': removal_torque,
+                        'diameter': diameter,
+                        'thread_pitch': thread_pitch,
+                        'k_factor': k_factor,
+                        'conventional_preload': conventional_preload,
+                        'wh_preload': wh_preload,
+                        'conv_uncertainty': conv_uncertainty,
+                        'wh_uncertainty': wh_uncertainty,
+                        'conv_min_preload': conv_min_preload,
+                        'conv_max_preload': conv_max_preload,
+                        'wh_min_preload': wh_min_preload,
+                        'wh_max_preload': wh_max_preload,
+                        'uncertainty_reduction': uncertainty_reduction,
+                        'preload_difference': preload_difference,
+                        'conv_stress': conv_stress,
+                        'wh_stress': wh_stress,
+                        'conv_safety': conv_safety,
+                        'wh_safety': wh_safety,
+                        'conv_risk': conv_risk,
+                        'wh_risk': wh_risk,
+                        'in_conventional_range': in_conventional_range
+                    }
+                    
+                    if input_method == "Select from Implant System Database":
+                        st.session_state.calculation_results['compare']['system'] = selected_system
+                        st.session_state.calculation_results['compare']['model'] = selected_model
+                    
+                    st.session_state.compare_input_key = input_key
                 
-                if input_method == "Select from Implant System Database":
-                    st.session_state.calculation_results['compare']['system'] = selected_system
-                    st.session_state.calculation_results['compare']['model'] = selected_model 
\ No newline at end of file
+                _render_comparison(st.session_state.calculation_results['compare'])
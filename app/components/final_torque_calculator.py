@@ -8,15 +8,15 @@ a desired preload using the Wadhwani-Hess method.
 
 import streamlit as st
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
 import math
 import json
 from pathlib import Path
 
 # Import calculation functions
 import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
+_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.append(str(_ROOT))
 from src.core.preload import (
     calculate_preload,
     calculate_final_torque,
@@ -25,6 +25,111 @@ from src.core.preload import (
 )
 
 
+# Equation 6 introduction shown at the top of the page
+_INTRO_CARD_HTML = """
+<div style="background-color: #1e2a38; color: white; padding: 1.5rem; border-radius: 8px; margin: 1rem 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+    <p style="font-size: 1.05rem; line-height: 1.6; margin: 0;">This calculator implements <b>Equation 6</b> from the Wadhwani-Hess paper:
+    <br>T<sub>i</sub> = (p × T<sub>t initial</sub> × P<sub>desired</sub>) / (π × (T<sub>t initial</sub> - T<sub>r</sub>))</p>
+    <p style="font-size: 1.05rem; line-height: 1.6; margin-top: 0.5rem;">Where T<sub>i</sub> is final torque, p is thread pitch, T<sub>t initial</sub> is initial tightening torque,
+    T<sub>r</sub> is removal torque, and P<sub>desired</sub> is the desired preload.</p>
+</div>
+"""
+
+# Static labels for the calculation details expander
+_EXACT_FORMULA_HTML = """
+<h4>Exact Formula (Equation 6):</h4>
+<p>T<sub>i</sub> = (p × T<sub>t initial</sub> × P<sub>desired</sub>) / (π × (T<sub>t initial</sub> - T<sub>r</sub>))</p>
+"""
+
+_RATIO_FORMULA_HTML = """
+<h4>Ratio Method:</h4>
+<p>T<sub>i</sub> = T<sub>t initial</sub> × (P<sub>desired</sub> / P<sub>initial</sub>)</p>
+"""
+
+
+def _render_final_torque(results):
+    """Display the final torque result, chart and calculation details."""
+    # Display the main result with large font
+    st.markdown(f"""
+    <div style="background-color: #1e2a38; color: white; text-align: center; padding: 2rem; border-radius: 8px; margin: 1rem 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+        <h3 style="color: white; margin-bottom: 1rem;">Final Tightening Torque</h3>
+        <p style="font-size: 2.5rem; font-weight: bold; color: white; margin-bottom: 0.5rem;">
+            {results['final_torque']:.2f} N-cm
+        </p>
+        <p>To achieve {results['desired_preload']:.2f} N preload (±{results['uncertainty_percent']}%)</p>
+        <p>Preload Range: {results['min_preload']:.2f} N to {results['max_preload']:.2f} N</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Show ratio method result for comparison
+    st.markdown(f"""
+    <p><b>Alternative Calculation (Ratio Method):</b> {results['final_torque_ratio']:.2f} N-cm 
+    <span style="color: #6c757d; font-size: 0.9rem;">
+        (Difference: {abs(results['final_torque'] - results['final_torque_ratio']):.2f} N-cm)
+    </span></p>
+    """, unsafe_allow_html=True)
+    
+    # Create torque-preload chart (Plotly is only imported once there is a chart to draw)
+    import plotly.express as px
+    
+    torque_range = np.linspace(results['initial_torque'] * 0.5, results['final_torque'] * 1.5, 100)
+    preload_values = torque_range * (results['initial_preload'] / results['initial_torque'])
+    
+    fig = px.line(
+        x=torque_range,
+        y=preload_values,
+        labels={"x": "Torque (N-cm)", "y": "Preload (N)"},
+        title="Torque-Preload Relationship"
+    )
+    
+    # Add markers for initial and final points
+    fig.add_scatter(
+        x=[results['initial_torque'], results['final_torque']],
+        y=[results['initial_preload'], results['desired_preload']],
+        mode="markers+text",
+        marker=dict(size=10, color=["blue", "red"]),
+        text=["Initial", "Final"],
+        textposition="top center",
+        showlegend=False
+    )
+    
+    # Add horizontal line for target preload
+    fig.add_shape(
+        type="line",
+        x0=results['initial_torque'] * 0.5,
+        y0=results['desired_preload'],
+        x1=results['final_torque'],
+        y1=results['desired_preload'],
+        line=dict(color="green", width=2, dash="dash"),
+    )
+    
+    # Add vertical line for calculated torque
+    fig.add_shape(
+        type="line",
+        x0=results['final_torque'],
+        y0=0,
+        x1=results['final_torque'],
+        y1=results['desired_preload'],
+        line=dict(color="red", width=2, dash="dash"),
+    )
+    
+    fig.update_layout(height=300, margin=dict(l=20, r=20, t=40, b=20))
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Formula details
+    with st.expander("See Calculation Details"):
+        st.markdown(_EXACT_FORMULA_HTML + f"""
+        <p>T<sub>i</sub> = ({results['thread_pitch']} × {results['initial_torque']} × {results['desired_preload']}) / (π × ({results['initial_torque']} - {results['removal_torque']}))</p>
+        <p>T<sub>i</sub> = ({results['thread_pitch'] * results['initial_torque'] * results['desired_preload']:.2f}) / ({math.pi:.4f} × {results['initial_torque'] - results['removal_torque']:.2f})</p>
+        <p>T<sub>i</sub> = ({results['thread_pitch'] * results['initial_torque'] * results['desired_preload']:.2f}) / ({math.pi * (results['initial_torque'] - results['removal_torque']):.4f})</p>
+        <p>T<sub>i</sub> = {results['final_torque']:.2f} N-cm</p>
+        """ + _RATIO_FORMULA_HTML + f"""
+        <p>T<sub>i</sub> = {results['initial_torque']} × ({results['desired_preload']} / {results['initial_preload']:.2f})</p>
+        <p>T<sub>i</sub> = {results['initial_torque']} × {results['desired_preload'] / results['initial_preload']:.4f}</p>
+        <p>T<sub>i</sub> = {results['final_torque_ratio']:.2f} N-cm</p>
+        """, unsafe_allow_html=True)
+
+
 def show_final_torque_calculator():
     """Display the final torque calculator interface."""
     st.markdown('<h1 class="main-header">Final Torque Calculator</h1>', unsafe_allow_html=True)
@@ -32,14 +137,7 @@ def show_final_torque_calculator():
     
     # Main container
     with st.container():
-        st.markdown("""
-        <div style="background-color: #1e2a38; color: white; padding: 1.5rem; border-radius: 8px; margin: 1rem 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <p style="font-size: 1.05rem; line-height: 1.6; margin: 0;">This calculator implements <b>Equation 6</b> from the Wadhwani-Hess paper:
-            <br>T<sub>i</sub> = (p × T<sub>t initial</sub> × P<sub>desired</sub>) / (π × (T<sub>t initial</sub> - T<sub>r</sub>))</p>
-            <p style="font-size: 1.05rem; line-height: 1.6; margin-top: 0.5rem;">Where T<sub>i</sub> is final torque, p is thread pitch, T<sub>t initial</sub> is initial tightening torque,
-            T<sub>r</sub> is removal torque, and P<sub>desired</sub> is the desired preload.</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_INTRO_CARD_HTML, unsafe_allow_html=True)
         
         # Input method selection
         input_method = st.radio(
@@ -59,19 +157,19 @@ def show_final_torque_calculator():
                 implant_data = st.session_state.implant_data
                 
                 # System selection
-                system_names = list(implant_data["implant_systems"].keys())
+                system_names = st.session_state.system_names
                 selected_system = st.selectbox(
                     "Select Implant System",
                     system_names,
-                    format_func=lambda x: x.replace("_", " ")
+                    format_func=st.session_state.display_names.__getitem__
                 )
                 
                 # Model selection
-                model_names = list(implant_data["implant_systems"][selected_system].keys())
+                model_names = st.session_state.model_names_by_system[selected_system]
                 selected_model = st.selectbox(
                     "Select Model",
                     model_names,
-                    format_func=lambda x: x.replace("_", " ")
+                    format_func=st.session_state.display_names.__getitem__
                 )
                 
                 # Get screw data
@@ -80,7 +178,7 @@ def show_final_torque_calculator():
                 # Display information about the selected system
                 st.markdown(f"""
                 <div style="background-color: white; color: #333; padding: 1.5rem; border-radius: 8px; margin: 1rem 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-                    <h4 style="color: #1e2a38; margin-bottom: 0.75rem;">{selected_system.replace('_', ' ')} {selected_model}</h4>
+                    <h4 style="color: #1e2a38; margin-bottom: 0.75rem;">{st.session_state.display_names[selected_system]} {selected_model}</h4>
                     <ul style="list-style-type: none; padding-left: 0;">
                         <li style="margin-bottom: 0.5rem;"><b>Connection Type:</b> {implant_data["implant_systems"][selected_system][selected_model]["connection_type"]}</li>
                         <li style="margin-bottom: 0.5rem;"><b>Screw Material:</b> {screw_data["material"]}</li>
@@ -110,6 +208,8 @@ def show_final_torque_calculator():
                 conventional_preload = float(screw_data["recommended_torque"]) / (k_factor * diameter_cm)
             
             else:  # Manual Entry
+                selected_system = selected_model = None
+                
                 thread_pitch_mm = st.number_input(
                     "Thread Pitch (mm)",
                     min_value=0.1,
@@ -179,131 +279,56 @@ def show_final_torque_calculator():
         with col2:
             st.subheader("Results")
             
+            # Inputs of the current form, compared against those of the last calculation
+            input_key = (
+                input_method, selected_system, selected_model,
+                initial_torque, removal_torque, thread_pitch, desired_preload
+            )
+            
             if calculate_pressed or st.session_state.get('last_calculation') == 'final_torque':
                 # Store calculation type
                 st.session_state.last_calculation = 'final_torque'
                 
-                # Calculate final torque using the exact formula (Equation 6)
-                final_torque = calculate_final_torque(
-                    initial_torque, 
-                    removal_torque, 
-                    initial_preload, 
-                    desired_preload, 
-                    thread_pitch,
-                    use_ratio_method=False
-                )
-                
-                # Also calculate with ratio method for comparison
-                final_torque_ratio = calculate_final_torque(
-                    initial_torque, 
-                    removal_torque, 
-                    initial_preload, 
-                    desired_preload, 
-                    thread_pitch,
-                    use_ratio_method=True
-                )
-                
-                # Uncertainty range (9% as per the paper)
-                uncertainty_percent = 9
-                min_preload = desired_preload * (1 - uncertainty_percent/100)
-                max_preload = desired_preload * (1 + uncertainty_percent/100)
-                
-                # Display the main result with large font
-                st.markdown(f"""
-                <div style="background-color: #1e2a38; color: white; text-align: center; padding: 2rem; border-radius: 8px; margin: 1rem 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-                    <h3 style="color: white; margin-bottom: 1rem;">Final Tightening Torque</h3>
-                    <p style="font-size: 2.5rem; font-weight: bold; color: white; margin-bottom: 0.5rem;">
-                        {final_torque:.2f} N-cm
-                    </p>
-                    <p>To achieve {desired_preload:.2f} N preload (±{uncertainty_percent}%)</p>
-                    <p>Preload Range: {min_preload:.2f} N to {max_preload:.2f} N</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Show ratio method result for comparison
-                st.markdown(f"""
-                <p><b>Alternative Calculation (Ratio Method):</b> {final_torque_ratio:.2f} N-cm 
-                <span style="color: #6c757d; font-size: 0.9rem;">
-                    (Difference: {abs(final_torque - final_torque_ratio):.2f} N-cm)
-                </span></p>
-                """, unsafe_allow_html=True)
-                
-                # Create torque-preload chart
-                torque_range = np.linspace(initial_torque * 0.5, final_torque * 1.5, 100)
-                preload_values = [(torque/initial_torque) * initial_preload for torque in torque_range]
-                
-                fig = px.line(
-                    x=torque_range,
-                    y=preload_values,
-                    labels={"x": "Torque (N-cm)", "y": "Preload (N)"},
-                    title="Torque-Preload Relationship"
-                )
-                
-                # Add markers for initial and final points
-                fig.add_scatter(
-                    x=[initial_torque, final_torque],
-                    y=[initial_preload, desired_preload],
-                    mode="markers+text",
-                    marker=dict(size=10, color=["blue", "red"]),
-                    text=["Initial", "Final"],
-                    textposition="top center",
-                    showlegend=False
-                )
-                
-                # Add horizontal line for target preload
-                fig.add_shape(
-                    type="line",
-                    x0=initial_torque * 0.5,
-                    y0=desired_preload,
-                    x1=final_torque,
-                    y1=desired_preload,
-                    line=dict(color="green", width=2, dash="dash"),
-                )
-                
-                # Add vertical line for calculated torque
-                fig.add_shape(
-                    type="line",
-                    x0=final_torque,
-                    y0=0,
-                    x1=final_torque,
-                    y1=desired_preload,
-                    line=dict(color="red", width=2, dash="dash"),
-                )
-                
-                fig.update_layout(height=300, margin=dict(l=20, r=20, t=40, b=20))
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Formula details
-                with st.expander("See Calculation Details"):
-                    st.markdown(f"""
-                    <h4>Exact Formula (Equation 6):</h4>
-                    <p>T<sub>i</sub> = (p × T<sub>t initial</sub> × P<sub>desired</sub>) / (π × (T<sub>t initial</sub> - T<sub>r</sub>))</p>
-                    <p>T<sub>i</sub> = ({thread_pitch} × {initial_torque} × {desired_preload}) / (π × ({initial_torque} - {removal_torque}))</p>
-                    <p>T<sub>i</sub> = ({thread_pitch * initial_torque * desired_preload:.2f}) / ({math.pi:.4f} × {initial_torque - removal_torque:.2f})</p>
-                    <p>T<sub>i</sub> = ({thread_pitch * initial_torque * desired_preload:.2f}) / ({math.pi * (initial_torque - removal_torque):.4f})</p>
-                    <p>T<sub>i</sub> = {final_torque:.2f} N-cm</p>
+                if calculate_pressed or 'final_torque' not in st.session_state.calculation_results:
+                    # Calculate final torque using the exact formula (Equation 6)
+                    final_torque = calculate_final_torque(
+                        initial_torque, 
+                        removal_torque, 
+                        initial_preload, 
+                        desired_preload, 
+                        thread_pitch,
+                        use_ratio_method=False
+                    )
                     
-                    <h4>Ratio Method:</h4>
-                    <p>T<sub>i</sub> = T<sub>t initial</sub> × (P<sub>desired</sub> / P<sub>initial</sub>)</p>
-                    <p>T<sub>i</sub> = {initial_torque} × ({desired_preload} / {initial_preload:.2f})</p>
-                    <p>T<sub>i</sub> = {initial_torque} × {desired_preload / initial_preload:.4f}</p>
-                    <p>T<sub>i</sub> = {final_torque_ratio:.2f} N-cm</p>
-                    """, unsafe_allow_html=True)
-                
-                # Store results in session state for reporting
-                st.session_state.calculation_results['final_torque'] = {
-                    'initial_torque': initial_torque,
-                    'removal_torque': removal_torque,
-                    'thread_pitch': thread_pitch,
-                    'initial_preload': initial_preload,
-                    'desired_preload': desired_preload,
-                    'final_torque': final_torque,
-                    'final_torque_ratio': final_torque_ratio,
-                    'min_preload': min_preload,
-                    'max_preload': max_preload,
-                    'uncertainty_percent': uncertainty_percent,
-                }
+                    # Also calculate with ratio method for comparison
+                    final_torque_ratio = initial_torque * (desired_preload / initial_preload)
+                    
+                    # Uncertainty range (9% as per the paper)
+                    uncertainty_percent = 9
+                    min_preload = desired_preload * (1 - uncertainty_percent/100)
+                    max_preload = desired_preload * (1 + uncertainty_percent/100)
+                    
+                    # Store results in session state for reporting
+                    st.session_state.calculation_results['final_torque'] = {
+                        'initial_torque': initial_torque,
+                        'removal_torque': removal_torque,
+                        'thread_pitch': thread_pitch,
+                        'initial_preload': initial_preload,
+                        'desired_preload': desired_preload,
+                        'final_torque': final_torque,
+                        'final_torque_ratio': final_torque_ratio,
+                        'min_preload': min_preload,
+                        'max_preload': max_preload,
+                        'uncertainty_percent': uncertainty_percent,
+                    }
+                    
+                    if input_method == "Select from Implant System Database":
+                        st.session_state.calculation_results['final_torque']['system'] = selected_system
+                        st.session_state.calculation_results['final_torque']['model'] = selected_model
+                    
+                    st.session_state.final_torque_inputs = input_key
                 
-                if input_method == "Select from Implant System Database":
-                    st.session_state.calculation_results['final_torque']['system'] = selected_system
-                    st.session_state.calculation_results['final_torque']['model'] = selected_model 
\ No newline at end of file
+                if st.session_state.get('final_torque_inputs') == input_key:
+                    _render_final_torque(st.session_state.calculation_results['final_torque'])
+                else:
+                    st.info("Inputs have changed. Press **Calculate Final Torque** to update the results.")
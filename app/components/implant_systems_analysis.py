@@ -9,26 +9,39 @@ using both the Wadhwani-Hess and conventional methods.
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
 import math
 import json
 from pathlib import Path
 
 # Import calculation functions
 import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
+_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.append(str(_ROOT))
 from src.core.preload import (
-    calculate_preload,
-    estimate_uncertainty
-)
-from src.core.torque import (
-    estimate_preload_from_torque,
-    calculate_stress_from_preload,
-    calculate_safety_factor,
-    calculate_tensile_area,
-    assess_risk
+    estimate_uncertainty_batch,
+    calculate_preload_range_batch
 )
+from src.core.torque import RISK_LEVELS, analyze_implants_batch
+
+# Columns shown in the main comparison table
+DISPLAY_COLUMNS = [
+    "System", "Model", "Recommended Torque (N-cm)", 
+    "Conventional Preload (N)", "WH Preload (N)", 
+    "Conv Uncertainty (%)", "WH Uncertainty (%)",
+    "Conv Safety Factor", "WH Safety Factor",
+    "Conv Risk Level", "WH Risk Level"
+]
+
+# Introduction shown at the top of the page
+_INTRO_CARD_HTML = """
+<div style="background-color: #1e2a38; color: white; padding: 1.5rem; border-radius: 8px; margin: 1rem 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+    <p style="font-size: 1.05rem; line-height: 1.6; margin: 0;">This analysis provides a comprehensive comparison of different implant systems
+    and their preload characteristics using both the Wadhwani-Hess method and conventional methods.
+    The analysis evaluates preload, stress, safety factors, and risk levels for each system,
+    helping clinicians make informed decisions based on scientific data.</p>
+</div>
+"""
 
 
 def show_implant_systems_analysis():
@@ -36,19 +49,9 @@ def show_implant_systems_analysis():
     st.markdown('<h1 class="main-header">Implant Systems Analysis</h1>', unsafe_allow_html=True)
     st.markdown('<h2 class="subheader">Compare preload and safety across implant systems</h2>', unsafe_allow_html=True)
     
-    # Get implant systems data
-    implant_data = st.session_state.implant_data
-    
     # Main container
     with st.container():
-        st.markdown("""
-        <div style="background-color: #1e2a38; color: white; padding: 1.5rem; border-radius: 8px; margin: 1rem 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <p style="font-size: 1.05rem; line-height: 1.6; margin: 0;">This analysis provides a comprehensive comparison of different implant systems
-            and their preload characteristics using both the Wadhwani-Hess method and conventional methods.
-            The analysis evaluates preload, stress, safety factors, and risk levels for each system,
-            helping clinicians make informed decisions based on scientific data.</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_INTRO_CARD_HTML, unsafe_allow_html=True)
         
         # Removal torque assumption
         removal_factor = st.slider(
@@ -61,119 +64,229 @@ def show_implant_systems_analysis():
         ) / 100.0
         
         # Generate data for all implant systems
-        analysis_data = generate_implant_analysis(implant_data, removal_factor)
+        analysis_data = _analysis_df(st.session_state.implant_df, removal_factor)
         
         # Display the analysis
         show_analysis_results(analysis_data)
 
 
-def generate_implant_analysis(implant_data, removal_factor=0.85):
-    """Generate analysis data for all implant systems."""
-    analysis = []
-    
-    # Loop through all implant systems
-    for system_name, system_data in implant_data["implant_systems"].items():
-        for model_name, model_data in system_data.items():
-            # Get screw data
-            screw_data = model_data["screws"]["standard"]
-            
-            # Extract parameters
-            torque = float(screw_data["recommended_torque"])  # N-cm
-            diameter = float(screw_data["diameter"]) / 10  # mm to cm
-            thread_pitch = float(screw_data["thread_pitch"]) / 10  # mm to cm
-            k_factor = float(screw_data["K_factor"])
-            yield_strength = float(screw_data["yield_strength"])  # MPa
-            
-            # Estimate removal torque
-            removal_torque = torque * removal_factor
-            
-            # Calculate tensile area
-            tensile_area = calculate_tensile_area(float(screw_data["diameter"]), float(screw_data["thread_pitch"]))
-            
-            # Calculate conventional preload and uncertainty
-            conventional_preload = estimate_preload_from_torque(torque, diameter, k_factor)
-            conv_uncertainty, _ = estimate_uncertainty(torque, False)
-            
-            # Calculate Wadhwani-Hess preload and uncertainty
-            wh_preload = calculate_preload(torque, removal_torque, thread_pitch)
-            wh_uncertainty = 9  # 9% as per the paper
-            
-            # Calculate stress for both methods
-            conv_stress = calculate_stress_from_preload(conventional_preload, tensile_area)
-            wh_stress = calculate_stress_from_preload(wh_preload, tensile_area)
-            
-            # Calculate safety factors
-            conv_safety = calculate_safety_factor(conv_stress, yield_strength)
-            wh_safety = calculate_safety_factor(wh_stress, yield_strength)
-            
-            # Assess risk for both methods
-            conv_risk, _ = assess_risk(conv_safety)
-            wh_risk, _ = assess_risk(wh_safety)
-            
-            # Check if WH preload is within conventional range
-            conv_min = conventional_preload * (1 - conv_uncertainty/100)
-            conv_max = conventional_preload * (1 + conv_uncertainty/100)
-            in_range = conv_min <= wh_preload <= conv_max
-            
-            # Calculate uncertainty reduction
-            uncertainty_reduction = (conv_uncertainty - wh_uncertainty) / conv_uncertainty * 100
-            
-            # Add to analysis data
-            analysis.append({
-                "System": system_name.replace("_", " "),
-                "Model": model_name.replace("_", " "),
-                "Connection Type": model_data["connection_type"],
-                "Recommended Torque (N-cm)": torque,
-                "Diameter (mm)": screw_data["diameter"],
-                "Thread Pitch (mm)": screw_data["thread_pitch"],
-                "K-Factor": k_factor,
-                "Yield Strength (MPa)": yield_strength,
-                "Conventional Preload (N)": conventional_preload,
-                "WH Preload (N)": wh_preload,
-                "Conv Uncertainty (%)": conv_uncertainty,
-                "WH Uncertainty (%)": wh_uncertainty,
-                "Conv Stress (MPa)": conv_stress,
-                "WH Stress (MPa)": wh_stress,
-                "Conv Safety Factor": conv_safety,
-                "WH Safety Factor": wh_safety,
-                "Conv Risk Level": conv_risk,
-                "WH Risk Level": wh_risk,
-                "In Conv Range": in_range,
-                "Uncertainty Reduction (%)": uncertainty_reduction,
-                "Preload Difference (%)": (conventional_preload - wh_preload) / conventional_preload * 100
-            })
-    
-    return analysis
+def generate_implant_analysis(implant_df, removal_factor=0.85):
+    """Generate analysis data for all implant systems from the flattened implant table."""
+    torque = implant_df["recommended_torque"].to_numpy(dtype=np.float64)  # N-cm
+    diameter = implant_df["diameter"].to_numpy(dtype=np.float64)  # mm
+    thread_pitch = implant_df["thread_pitch"].to_numpy(dtype=np.float64)  # mm
+    k_factor = implant_df["k_factor"].to_numpy(dtype=np.float64)
+    yield_strength = implant_df["yield_strength"].to_numpy(dtype=np.float64)  # MPa
+    
+    # Preload, stress, safety factor and risk for both methods in one fused pass
+    (conventional_preload, wh_preload, conv_stress, wh_stress,
+     conv_safety, wh_safety, conv_risk, wh_risk) = analyze_implants_batch(
+        torque, diameter, thread_pitch, k_factor, yield_strength, removal_factor
+    )
+    
+    # Uncertainty percentages for both methods (the screws are taken as unlubricated)
+    conv_uncertainty, _ = estimate_uncertainty_batch(torque, False)
+    wh_uncertainty = 9  # 9% as per the paper
+    
+    # Check if WH preload is within conventional range
+    conv_min, conv_max = calculate_preload_range_batch(conventional_preload, conv_uncertainty)
+    in_range = (conv_min <= wh_preload) & (wh_preload <= conv_max)
+    
+    # Calculate uncertainty reduction and the preload difference
+    uncertainty_reduction = (conv_uncertainty - wh_uncertainty) / conv_uncertainty * 100
+    preload_difference = (conventional_preload - wh_preload) / conventional_preload * 100
+    
+    # Scalar columns are broadcast to every row by the DataFrame constructor
+    return pd.DataFrame({
+        "System": pd.Categorical(implant_df.index.get_level_values("system").str.replace("_", " ")),
+        "Model": pd.Categorical(implant_df.index.get_level_values("model").str.replace("_", " ")),
+        "Connection Type": pd.Categorical(implant_df["connection_type"]),
+        "Recommended Torque (N-cm)": torque,
+        "Diameter (mm)": diameter,
+        "Thread Pitch (mm)": thread_pitch,
+        "K-Factor": k_factor,
+        "Yield Strength (MPa)": yield_strength,
+        "Conventional Preload (N)": conventional_preload,
+        "WH Preload (N)": wh_preload,
+        "Conv Uncertainty (%)": conv_uncertainty,
+        "WH Uncertainty (%)": wh_uncertainty,
+        "Conv Stress (MPa)": conv_stress,
+        "WH Stress (MPa)": wh_stress,
+        "Conv Safety Factor": conv_safety,
+        "WH Safety Factor": wh_safety,
+        "Conv Risk Level": pd.Categorical.from_codes(conv_risk, categories=list(RISK_LEVELS), ordered=True),
+        "WH Risk Level": pd.Categorical.from_codes(wh_risk, categories=list(RISK_LEVELS), ordered=True),
+        "In Conv Range": in_range,
+        "Uncertainty Reduction (%)": uncertainty_reduction,
+        "Preload Difference (%)": preload_difference
+    })
+
+
+@st.cache_data
+def _analysis_df(implant_df, removal_factor):
+    """Build the analysis DataFrame (cached on the implant table and removal factor)."""
+    df = generate_implant_analysis(implant_df, removal_factor)
+    
+    # Derived columns for the charts: system labels for the X-axis and preload error bars
+    return df.assign(
+        System_Model=df["System"].str.cat(df["Model"], sep=" "),
+        **{
+            "Conv Preload Error (N)": df["Conventional Preload (N)"].to_numpy() * df["Conv Uncertainty (%)"].to_numpy() * 0.01,
+            "WH Preload Error (N)": df["WH Preload (N)"].to_numpy() * df["WH Uncertainty (%)"].to_numpy() * 0.01
+        }
+    )
+
+
+@st.cache_data
+def _display_table(df):
+    """Select the columns for the comparison table (cached on the analysis data)."""
+    return df.loc[:, DISPLAY_COLUMNS]
+
+
+@st.cache_data
+def _risk_counts(df):
+    """Count risk levels for both methods in a long-format table."""
+    risk_long = df[["Conv Risk Level", "WH Risk Level"]].rename(
+        columns={"Conv Risk Level": "Conventional", "WH Risk Level": "Wadhwani-Hess"}
+    ).melt(var_name="Method", value_name="Risk Level")
+    
+    return risk_long.groupby(["Method", "Risk Level"], observed=True).size().reset_index(name="Count")
+
+
+@st.cache_data
+def _build_risk_fig(risk_data):
+    """Build the risk level distribution chart (cached on the risk counts)."""
+    import plotly.express as px
+    
+    fig = px.bar(
+        risk_data,
+        x="Risk Level",
+        y="Count",
+        color="Method",
+        barmode="group",
+        title="Risk Level Distribution by Method",
+        category_orders={"Risk Level": ["Low", "Medium", "High"]}
+    )
+    
+    fig.update_layout(height=400)
+    
+    return fig
+
+
+@st.cache_data
+def _build_preload_fig(df):
+    """Build the preload comparison chart (cached on the analysis data)."""
+    import plotly.graph_objects as go
+    
+    x = df["System_Model"].to_numpy()
+    
+    return go.Figure(
+        data=[
+            go.Bar(
+                name="Conventional",
+                x=x,
+                y=df["Conventional Preload (N)"].to_numpy(),
+                error_y=dict(type="data", array=df["Conv Preload Error (N)"].to_numpy(), visible=True),
+                marker_color="#1f77b4"
+            ),
+            go.Bar(
+                name="Wadhwani-Hess",
+                x=x,
+                y=df["WH Preload (N)"].to_numpy(),
+                error_y=dict(type="data", array=df["WH Preload Error (N)"].to_numpy(), visible=True),
+                marker_color="#ff7f0e"
+            )
+        ],
+        layout=go.Layout(
+            title="Preload Comparison by Implant System",
+            xaxis_title="Implant System",
+            yaxis_title="Preload (N)",
+            barmode="group",
+            height=500
+        )
+    )
+
+
+@st.cache_data
+def _build_safety_fig(df):
+    """Build the safety factor chart (cached on the analysis data)."""
+    import plotly.graph_objects as go
+    
+    x = df["System_Model"].to_numpy()
+    
+    return go.Figure(
+        data=[
+            go.Bar(
+                name="Conventional",
+                x=x,
+                y=df["Conv Safety Factor"].to_numpy(),
+                marker_color="#1f77b4"
+            ),
+            go.Bar(
+                name="Wadhwani-Hess",
+                x=x,
+                y=df["WH Safety Factor"].to_numpy(),
+                marker_color="#ff7f0e"
+            )
+        ],
+        layout=go.Layout(
+            title="Safety Factor by Implant System",
+            xaxis_title="Implant System",
+            yaxis_title="Safety Factor",
+            barmode="group",
+            height=500,
+            # Safety limit line
+            shapes=[dict(
+                type="line",
+                x0=-0.5,
+                y0=1.5,
+                x1=len(df) - 0.5,
+                y1=1.5,
+                line=dict(color="red", width=2, dash="dash")
+            )],
+            annotations=[dict(
+                x=len(df) - 1,
+                y=1.55,
+                text="Safety Threshold",
+                showarrow=False,
+                font=dict(color="red")
+            )]
+        )
+    )
+
+
+@st.cache_data
+def _df_to_csv(df):
+    """Serialize the analysis data for download (cached on the DataFrame)."""
+    return df.to_csv(index=False).encode("utf-8")
 
 
 def show_analysis_results(analysis_data):
     """Display the analysis results."""
-    # Convert to DataFrame
-    df = pd.DataFrame(analysis_data)
+    df = analysis_data
     
     # Create main table view
     st.subheader("Implant Systems Comparison")
     
-    # Select columns for display
-    display_cols = [
-        "System", "Model", "Recommended Torque (N-cm)", 
-        "Conventional Preload (N)", "WH Preload (N)", 
-        "Conv Uncertainty (%)", "WH Uncertainty (%)",
-        "Conv Safety Factor", "WH Safety Factor",
-        "Conv Risk Level", "WH Risk Level"
-    ]
-    
     # Display table
-    st.dataframe(df[display_cols], use_container_width=True)
+    st.dataframe(_display_table(df), use_container_width=True)
     
     # Summary metrics
     st.subheader("Summary Metrics")
     
-    # Calculate averages
-    avg_conv_preload = df["Conventional Preload (N)"].mean()
-    avg_wh_preload = df["WH Preload (N)"].mean()
-    avg_reduction = df["Uncertainty Reduction (%)"].mean()
-    avg_preload_diff = df["Preload Difference (%)"].mean()
+    # Calculate averages and the in-range count in a single aggregation
+    summary = df.agg({
+        "Conventional Preload (N)": "mean",
+        "WH Preload (N)": "mean",
+        "Uncertainty Reduction (%)": "mean",
+        "Preload Difference (%)": "mean",
+        "In Conv Range": "sum"
+    })
+    avg_conv_preload = summary["Conventional Preload (N)"]
+    avg_wh_preload = summary["WH Preload (N)"]
+    avg_reduction = summary["Uncertainty Reduction (%)"]
+    avg_preload_diff = summary["Preload Difference (%)"]
+    systems_in_range = int(summary["In Conv Range"])
     
     # Display metrics in columns
     metric_cols = st.columns(4)
@@ -200,7 +313,6 @@ def show_analysis_results(analysis_data):
         )
     
     with metric_cols[3]:
-        systems_in_range = df["In Conv Range"].sum()
         st.metric(
             label="Systems in Conventional Range",
             value=f"{systems_in_range}/{len(df)}",
@@ -211,77 +323,17 @@ def show_analysis_results(analysis_data):
     st.subheader("Risk Level Distribution")
     
     # Calculate risk level counts
-    conv_risk_counts = df["Conv Risk Level"].value_counts().reset_index()
-    conv_risk_counts.columns = ["Risk Level", "Count"]
-    conv_risk_counts["Method"] = "Conventional"
-    
-    wh_risk_counts = df["WH Risk Level"].value_counts().reset_index()
-    wh_risk_counts.columns = ["Risk Level", "Count"]
-    wh_risk_counts["Method"] = "Wadhwani-Hess"
-    
-    # Combine risk data
-    risk_data = pd.concat([conv_risk_counts, wh_risk_counts])
+    risk_data = _risk_counts(df)
     
     # Create risk distribution chart
-    fig = px.bar(
-        risk_data,
-        x="Risk Level",
-        y="Count",
-        color="Method",
-        barmode="group",
-        title="Risk Level Distribution by Method",
-        category_orders={"Risk Level": ["Low", "Medium", "High"]}
-    )
-    
-    fig.update_layout(height=400)
+    fig = _build_risk_fig(risk_data)
     st.plotly_chart(fig, use_container_width=True)
     
     # Preload comparison chart
     st.subheader("Preload Comparison by System")
     
-    # Create system labels for X-axis
-    df["System_Model"] = df["System"] + " " + df["Model"]
-    
     # Create preload comparison chart
-    fig2 = go.Figure()
-    
-    # Calculate error values for conventional method
-    conv_error_values = df["Conventional Preload (N)"] * df["Conv Uncertainty (%)"] / 100
-    
-    fig2.add_trace(go.Bar(
-        name="Conventional",
-        x=df["System_Model"],
-        y=df["Conventional Preload (N)"],
-        error_y=dict(
-            type="data",
-            array=conv_error_values.tolist(),
-            visible=True
-        ),
-        marker_color="#1f77b4"
-    ))
-    
-    # Calculate error values for Wadhwani-Hess method
-    wh_error_values = df["WH Preload (N)"] * df["WH Uncertainty (%)"] / 100
-    
-    fig2.add_trace(go.Bar(
-        name="Wadhwani-Hess",
-        x=df["System_Model"],
-        y=df["WH Preload (N)"],
-        error_y=dict(
-            type="data",
-            array=wh_error_values.tolist(),
-            visible=True
-        ),
-        marker_color="#ff7f0e"
-    ))
-    
-    fig2.update_layout(
-        title="Preload Comparison by Implant System",
-        xaxis_title="Implant System",
-        yaxis_title="Preload (N)",
-        barmode="group",
-        height=500
-    )
+    fig2 = _build_preload_fig(df)
     
     st.plotly_chart(fig2, use_container_width=True)
     
@@ -289,51 +341,7 @@ def show_analysis_results(analysis_data):
     st.subheader("Safety Factor Analysis")
     
     # Create safety factor chart
-    fig3 = go.Figure()
-    
-    # Add safety limit line
-    fig3.add_shape(
-        type="line",
-        x0=-0.5,
-        y0=1.5,
-        x1=len(df) - 0.5,
-        y1=1.5,
-        line=dict(
-            color="red",
-            width=2,
-            dash="dash",
-        )
-    )
-    
-    fig3.add_annotation(
-        x=len(df) - 1,
-        y=1.55,
-        text="Safety Threshold",
-        showarrow=False,
-        font=dict(color="red")
-    )
-    
-    fig3.add_trace(go.Bar(
-        name="Conventional",
-        x=df["System_Model"],
-        y=df["Conv Safety Factor"],
-        marker_color="#1f77b4"
-    ))
-    
-    fig3.add_trace(go.Bar(
-        name="Wadhwani-Hess",
-        x=df["System_Model"],
-        y=df["WH Safety Factor"],
-        marker_color="#ff7f0e"
-    ))
-    
-    fig3.update_layout(
-        title="Safety Factor by Implant System",
-        xaxis_title="Implant System",
-        yaxis_title="Safety Factor",
-        barmode="group",
-        height=500
-    )
+    fig3 = _build_safety_fig(df)
     
     st.plotly_chart(fig3, use_container_width=True)
     
@@ -342,10 +350,9 @@ def show_analysis_results(analysis_data):
         st.dataframe(df, use_container_width=True)
     
     # Export option
-    csv = df.to_csv(index=False)
     st.download_button(
         label="Download Analysis as CSV",
-        data=csv,
+        data=_df_to_csv(df),
         file_name="implant_systems_analysis.csv",
         mime="text/csv",
         help="Download the complete analysis data for further processing"
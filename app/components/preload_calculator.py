@@ -7,23 +7,149 @@ using the Wadhwani-Hess method.
 """
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.graph_objects as go
 import math
-import json
+import string
+from collections import namedtuple
 from pathlib import Path
 
 # Import calculation functions
 import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from src.core.preload import (
-    calculate_preload,
-    calculate_self_loosening,
-    calculate_primary_locking
+_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.append(str(_ROOT))
+from src.core.preload import calculate_preload_components
+
+
+# Equation 3 introduction shown at the top of the page
+_INTRO_CARD_HTML = """
+<div style="background-color: #1e2a38; color: white; padding: 1.5rem; border-radius: 8px; margin: 1rem 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+    <p style="font-size: 1.05rem; line-height: 1.6; margin: 0;">This calculator implements <b>Equation 3</b> from the Wadhwani-Hess paper:
+    <br>P = (Tt - Tr) × π / p</p>
+    <p style="font-size: 1.05rem; line-height: 1.6; margin-top: 0.5rem;">Where P is preload, Tt is tightening torque, Tr is removal torque, and p is thread pitch.</p>
+</div>
+"""
+
+# Information card for the selected implant system
+_SYSTEM_INFO_TEMPLATE = string.Template("""
+<div style="background-color: #ffffff; color: #333333; padding: 1.5rem; border-radius: 8px; margin: 1rem 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+    <h4 style="color: #2c3e50; margin-bottom: 15px;">$system $model</h4>
+    <ul style="font-size: 1.05rem; line-height: 1.5; color: #333333;">
+        <li>Connection Type: $connection_type</li>
+        <li>Screw Material: $material</li>
+        <li>Recommended Torque: $recommended_torque N-cm</li>
+    </ul>
+</div>
+""")
+
+# Result card, followed by the heading for the component metrics
+_RESULT_CARD_TEMPLATE = string.Template("""
+<div style="background-color: #ffffff; color: #333333; padding: 2rem; border-radius: 8px; margin: 1rem 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1); text-align: center;">
+    <h3 style="color: #2c3e50; margin-bottom: 15px;">Calculated Preload</h3>
+    <p style="font-size: 2.5rem; font-weight: bold; color: #2c3e50;">
+        $preload N
+    </p>
+    <p style="color: #333333;">Uncertainty Range (±$uncertainty_percent%):<br>
+    $min_preload N to $max_preload N</p>
+</div>
+<h4>Component Analysis</h4>
+""")
+
+# Step-by-step application of Equation 3
+_DETAILS_TEMPLATE = string.Template("""
+<h4>Formula Application:</h4>
+<p>P = (T<sub>t</sub> - T<sub>r</sub>) × π / p</p>
+<p>P = ($tightening_torque - $removal_torque) × π / $thread_pitch</p>
+<p>P = $torque_difference × $pi / $thread_pitch</p>
+<p>P = $torque_difference_pi / $thread_pitch</p>
+<p>P = $preload N</p>
+""")
+
+_PI = math.pi
+
+# Uncertainty of the Wadhwani-Hess method (9% as per the paper)
+WH_UNCERTAINTY_PERCENT = 9
+_UNC_LOW = 1 - WH_UNCERTAINTY_PERCENT/100
+_UNC_HIGH = 1 + WH_UNCERTAINTY_PERCENT/100
+
+PreloadResults = namedtuple(
+    "PreloadResults",
+    ["preload", "self_loosening", "primary_locking", "min_preload", "max_preload"]
 )
 
 
+@st.cache_data(max_entries=512, show_spinner=False)
+def _preload_results(tightening_torque, removal_torque, thread_pitch):
+    """Calculate the preload, its components and uncertainty range (cached on the inputs)."""
+    preload, self_loosening, primary_locking = calculate_preload_components(
+        tightening_torque, removal_torque, thread_pitch
+    )
+    
+    return PreloadResults(
+        preload=preload,
+        self_loosening=self_loosening,
+        primary_locking=primary_locking,
+        min_preload=preload * _UNC_LOW,
+        max_preload=preload * _UNC_HIGH
+    )
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _render_preload_html(tightening_torque, removal_torque, thread_pitch):
+    """Render the result card and calculation details HTML (cached on the inputs)."""
+    preload, _, _, min_preload, max_preload = _preload_results(tightening_torque, removal_torque, thread_pitch)
+    torque_difference = tightening_torque - removal_torque
+    
+    result_html = _RESULT_CARD_TEMPLATE.substitute(
+        preload=f"{preload:.2f}",
+        uncertainty_percent=WH_UNCERTAINTY_PERCENT,
+        min_preload=f"{min_preload:.2f}",
+        max_preload=f"{max_preload:.2f}"
+    )
+    details_html = _DETAILS_TEMPLATE.substitute(
+        tightening_torque=tightening_torque,
+        removal_torque=removal_torque,
+        thread_pitch=thread_pitch,
+        torque_difference=torque_difference,
+        pi=f"{_PI:.4f}",
+        torque_difference_pi=f"{torque_difference * _PI:.4f}",
+        preload=f"{preload:.2f}"
+    )
+    
+    return result_html, details_html
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _build_gauge_fig(preload, min_preload, max_preload):
+    """Build the preload gauge (cached on the preload and its uncertainty range)."""
+    import plotly.graph_objects as go
+    
+    gauge_max = max(1200, max_preload * 1.2)
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=preload,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Preload (N)"},
+        gauge={
+            'axis': {'range': [0, gauge_max]},
+            'bar': {'color': "#1f77b4"},
+            'steps': [
+                {'range': [0, min_preload], 'color': "#f8d7da"},
+                {'range': [min_preload, max_preload], 'color': "#d1e7dd"},
+                {'range': [max_preload, gauge_max], 'color': "#f8d7da"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': preload
+            }
+        }
+    ))
+    
+    fig.update_layout(height=250, margin=dict(l=20, r=20, t=30, b=20))
+    
+    return fig
+
+
 def show_preload_calculator():
     """Display the preload calculator interface."""
     st.markdown('<h1 class="main-header">Preload Calculator</h1>', unsafe_allow_html=True)
@@ -31,13 +157,7 @@ def show_preload_calculator():
     
     # Main container
     with st.container():
-        st.markdown("""
-        <div style="background-color: #1e2a38; color: white; padding: 1.5rem; border-radius: 8px; margin: 1rem 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <p style="font-size: 1.05rem; line-height: 1.6; margin: 0;">This calculator implements <b>Equation 3</b> from the Wadhwani-Hess paper:
-            <br>P = (Tt - Tr) × π / p</p>
-            <p style="font-size: 1.05rem; line-height: 1.6; margin-top: 0.5rem;">Where P is preload, Tt is tightening torque, Tr is removal torque, and p is thread pitch.</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_INTRO_CARD_HTML, unsafe_allow_html=True)
         
         # Input method selection
         input_method = st.radio(
@@ -57,123 +177,102 @@ def show_preload_calculator():
                 implant_data = st.session_state.implant_data
                 
                 # System selection
-                system_names = list(implant_data["implant_systems"].keys())
+                system_names = st.session_state.system_names
                 selected_system = st.selectbox(
                     "Select Implant System",
                     system_names,
-                    format_func=lambda x: x.replace("_", " ")
+                    format_func=st.session_state.display_names.__getitem__
                 )
                 
                 # Model selection
-                model_names = list(implant_data["implant_systems"][selected_system].keys())
+                model_names = st.session_state.model_names_by_system[selected_system]
                 selected_model = st.selectbox(
                     "Select Model",
                     model_names,
-                    format_func=lambda x: x.replace("_", " ")
+                    format_func=st.session_state.display_names.__getitem__
                 )
                 
                 # Get screw data
                 screw_data = implant_data["implant_systems"][selected_system][selected_model]["screws"]["standard"]
                 
                 # Display information about the selected system
-                st.markdown(f"""
-                <div style="background-color: #ffffff; color: #333333; padding: 1.5rem; border-radius: 8px; margin: 1rem 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-                    <h4 style="color: #2c3e50; margin-bottom: 15px;">{selected_system.replace('_', ' ')} {selected_model}</h4>
-                    <ul style="font-size: 1.05rem; line-height: 1.5; color: #333333;">
-                        <li>Connection Type: {implant_data["implant_systems"][selected_system][selected_model]["connection_type"]}</li>
-                        <li>Screw Material: {screw_data["material"]}</li>
-                        <li>Recommended Torque: {screw_data["recommended_torque"]} N-cm</li>
-                    </ul>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_SYSTEM_INFO_TEMPLATE.substitute(
+                    system=st.session_state.display_names[selected_system],
+                    model=selected_model,
+                    connection_type=implant_data["implant_systems"][selected_system][selected_model]["connection_type"],
+                    material=screw_data["material"],
+                    recommended_torque=screw_data["recommended_torque"]
+                ), unsafe_allow_html=True)
                 
                 # Prefill thread pitch from database but allow override
-                thread_pitch_mm = st.number_input(
-                    "Thread Pitch (mm)",
-                    min_value=0.1,
-                    max_value=1.0,
-                    value=float(screw_data["thread_pitch"]),
-                    step=0.05,
-                    format="%.2f"
-                )
-                thread_pitch = thread_pitch_mm / 10  # Convert mm to cm
+                default_thread_pitch = float(screw_data["thread_pitch"])
                 
                 # Default torque values
                 default_tightening = float(screw_data["recommended_torque"])
-                default_removal = default_tightening * 0.85  # Estimate removal as 85% of tightening
+                # Estimate removal as 85% of tightening, kept below the tightening torque
+                default_removal = min(default_tightening * 0.85, default_tightening - 0.1)
             
             else:  # Manual Entry
+                default_thread_pitch = 0.4
+                
+                # Default torque values for manual entry
+                default_tightening = 35.0
+                default_removal = 29.5
+            
+            # Measurements are submitted together, so editing them does not rerun the page
+            with st.form("preload_form"):
                 thread_pitch_mm = st.number_input(
                     "Thread Pitch (mm)",
                     min_value=0.1,
                     max_value=1.0,
-                    value=0.4,
+                    value=default_thread_pitch,
                     step=0.05,
                     format="%.2f"
                 )
                 thread_pitch = thread_pitch_mm / 10  # Convert mm to cm
                 
-                # Default torque values for manual entry
-                default_tightening = 35.0
-                default_removal = 29.5
-            
-            # Torque measurements
-            tightening_torque = st.number_input(
-                "Tightening Torque (N-cm)",
-                min_value=1.0,
-                max_value=100.0,
-                value=default_tightening,
-                step=0.1,
-                format="%.1f"
-            )
-            
-            removal_torque = st.number_input(
-                "Removal Torque (N-cm)",
-                min_value=1.0,
-                max_value=tightening_torque - 0.1,  # Must be less than tightening
-                value=min(default_removal, tightening_torque - 0.1),
-                step=0.1,
-                format="%.1f"
-            )
-            
-            # Calculate button
-            calculate_pressed = st.button("Calculate Preload", type="primary", use_container_width=True)
+                # Torque measurements
+                tightening_torque = st.number_input(
+                    "Tightening Torque (N-cm)",
+                    min_value=1.0,
+                    max_value=100.0,
+                    value=default_tightening,
+                    step=0.1,
+                    format="%.1f"
+                )
+                
+                # Must be less than tightening; checked on submit since the form holds both values
+                removal_torque = st.number_input(
+                    "Removal Torque (N-cm)",
+                    min_value=1.0,
+                    max_value=99.9,
+                    value=default_removal,
+                    step=0.1,
+                    format="%.1f"
+                )
+                
+                # Calculate button
+                calculate_pressed = st.form_submit_button("Calculate Preload", type="primary", use_container_width=True)
         
         with col2:
             st.subheader("Results")
             
-            if calculate_pressed or st.session_state.get('last_calculation') == 'preload':
+            if removal_torque >= tightening_torque:
+                st.error("Removal torque must be less than tightening torque.")
+            
+            elif calculate_pressed or st.session_state.get('last_calculation') == 'preload':
                 # Store calculation type
                 st.session_state.last_calculation = 'preload'
                 
-                # Calculate preload
-                preload = calculate_preload(tightening_torque, removal_torque, thread_pitch)
-                
-                # Calculate additional information
-                self_loosening = calculate_self_loosening(tightening_torque, removal_torque)
-                primary_locking = calculate_primary_locking(tightening_torque, removal_torque)
-                
-                # Uncertainty range (9% as per the paper)
-                uncertainty_percent = 9
-                min_preload = preload * (1 - uncertainty_percent/100)
-                max_preload = preload * (1 + uncertainty_percent/100)
-                
-                # Display the main result with large font
-                st.markdown(f"""
-                <div style="background-color: #ffffff; color: #333333; padding: 2rem; border-radius: 8px; margin: 1rem 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1); text-align: center;">
-                    <h3 style="color: #2c3e50; margin-bottom: 15px;">Calculated Preload</h3>
-                    <p style="font-size: 2.5rem; font-weight: bold; color: #2c3e50;">
-                        {preload:.2f} N
-                    </p>
-                    <p style="color: #333333;">Uncertainty Range (±{uncertainty_percent}%):<br>
-                    {min_preload:.2f} N to {max_preload:.2f} N</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Additional metrics
-                st.markdown("""
-                <h4>Component Analysis</h4>
-                """, unsafe_allow_html=True)
+                # Calculate preload, its components and the uncertainty range
+                preload, self_loosening, primary_locking, min_preload, max_preload = _preload_results(
+                    tightening_torque, removal_torque, thread_pitch
+                )
+                result_html, details_html = _render_preload_html(tightening_torque, removal_torque, thread_pitch)
+                uncertainty_percent = WH_UNCERTAINTY_PERCENT
+                
+                # Display the main result with large font, followed by the heading for the component metrics
+                st.markdown(result_html, unsafe_allow_html=True)
                 
                 # Create columns for metrics
                 m1, m2 = st.columns(2)
@@ -191,41 +290,24 @@ def show_preload_calculator():
                         help="The torque component that resists loosening due to friction"
                     )
                 
-                # Create gauge chart for preload
-                fig = go.Figure(go.Indicator(
-                    mode="gauge+number",
-                    value=preload,
-                    domain={'x': [0, 1], 'y': [0, 1]},
-                    title={'text': "Preload (N)"},
-                    gauge={
-                        'axis': {'range': [0, max(1200, max_preload * 1.2)]},
-                        'bar': {'color': "#1f77b4"},
-                        'steps': [
-                            {'range': [0, min_preload], 'color': "#f8d7da"},
-                            {'range': [min_preload, max_preload], 'color': "#d1e7dd"},
-                            {'range': [max_preload, max(1200, max_preload * 1.2)], 'color': "#f8d7da"}
-                        ],
-                        'threshold': {
-                            'line': {'color': "red", 'width': 4},
-                            'thickness': 0.75,
-                            'value': preload
-                        }
-                    }
-                ))
-                
-                fig.update_layout(height=250, margin=dict(l=20, r=20, t=30, b=20))
-                st.plotly_chart(fig, use_container_width=True)
+                # Preload readout, with the bar filled against the gauge scale
+                gauge_max = max(1200, max_preload * 1.2)
+                st.metric(
+                    label="Preload (N)",
+                    value=f"{preload:.2f}",
+                    delta=f"±{uncertainty_percent}%",
+                    delta_color="off"
+                )
+                st.progress(min(1.0, preload / gauge_max))
+                
+                # The full Plotly gauge is only built when requested
+                if st.toggle("Show gauge"):
+                    fig = _build_gauge_fig(preload, min_preload, max_preload)
+                    st.plotly_chart(fig, use_container_width=True, key="preload_gauge")
                 
                 # Formula details
                 with st.expander("See Calculation Details"):
-                    st.markdown(f"""
-                    <h4>Formula Application:</h4>
-                    <p>P = (T<sub>t</sub> - T<sub>r</sub>) × π / p</p>
-                    <p>P = ({tightening_torque} - {removal_torque}) × π / {thread_pitch}</p>
-                    <p>P = {tightening_torque - removal_torque} × {math.pi:.4f} / {thread_pitch}</p>
-                    <p>P = {((tightening_torque - removal_torque) * math.pi):.4f} / {thread_pitch}</p>
-                    <p>P = {preload:.2f} N</p>
-                    """, unsafe_allow_html=True)
+                    st.markdown(details_html, unsafe_allow_html=True)
                 
                 # Store results in session state for reporting
                 st.session_state.calculation_results['preload'] = {
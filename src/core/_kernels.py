@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Compiled arithmetic kernels for the preload and torque calculations.
+
+The kernels hold only the arithmetic of the public functions in preload.py
+and torque.py; input validation stays in those Python wrappers. When Numba
+is installed the kernels are compiled with @njit (and cached on disk),
+otherwise they run as plain Python. Either way they accept floats as well
+as NumPy arrays. The preload range kernels are compiled with @vectorize into
+NumPy ufuncs, so they broadcast and support out=, reduce and accumulate.
+
+Since the wrappers reject zero pitches, areas and stresses before calling
+in, the @njit kernels use error_model="numpy": divisions follow IEEE rules
+instead of carrying Numba's per-division ZeroDivisionError check. The
+kernels enable only the fast-math flags that allow reassociation and
+reciprocal multiplication, not the no-NaN/no-Inf assumptions, so a division
+by zero still gives inf or NaN rather than an undefined result. All
+kernels, the ufuncs included, are compiled lazily rather than with eager
+signatures: the same kernel serves scalars and arrays, and importing the
+module does not start LLVM, so callers that only use the scalar functions
+never pay for compilation or cache loading.
+
+The kernels therefore double as the unchecked variants of the public
+functions: a caller that has already validated its inputs, e.g. with
+torque.validate_positive, can call them directly in a hot loop or from its
+own @njit code. They are compiled with nogil=True, so worker threads (e.g.
+a Monte Carlo run split over a ThreadPoolExecutor) execute them in parallel.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, vectorize
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Fallback for @njit when Numba is not installed: return the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    def vectorize(*args, **kwargs):
+        """Fallback for @vectorize when Numba is not installed: return the function unchanged."""
+        return lambda func: func
+
+
+_PI = math.pi
+_INV_PI = 1.0 / math.pi
+_PI_4 = math.pi * 0.25
+_THREAD_COEFF = 0.9382  # Tensile stress area pitch coefficient (ISO 898-1)
+
+# The fast-math flags that let LLVM reassociate and use reciprocals, without
+# "nnan" and "ninf", so inf and NaN results stay defined
+_FASTMATH_FLAGS = {"reassoc", "arcp", "contract", "nsz"}
+
+
+@njit(cache=True, fastmath=_FASTMATH_FLAGS, error_model="numpy", nogil=True)
+def preload_kernel(tightening_torque, removal_torque, thread_pitch):
+    """Equation 3: P = (Tt - Tr) * π / p"""
+    return (tightening_torque - removal_torque) * _PI / thread_pitch
+
+
+@njit(cache=True, fastmath=_FASTMATH_FLAGS, error_model="numpy", nogil=True)
+def final_torque_kernel(initial_torque, removal_torque, desired_preload, thread_pitch):
+    """Equation 6: Ti = (p * Tt * P_desired) / (π * (Tt - Tr))"""
+    return thread_pitch * initial_torque * desired_preload * _INV_PI / (initial_torque - removal_torque)
+
+
+@njit(cache=True, fastmath=_FASTMATH_FLAGS, error_model="numpy", nogil=True)
+def self_loosening_kernel(tightening_torque, removal_torque):
+    """Self-loosening component: (Tt - Tr) / 2"""
+    return (tightening_torque - removal_torque) * 0.5
+
+
+@njit(cache=True, fastmath=_FASTMATH_FLAGS, error_model="numpy", nogil=True)
+def primary_locking_kernel(tightening_torque, removal_torque):
+    """Primary locking component: (Tt + Tr) / 2"""
+    return (tightening_torque + removal_torque) * 0.5
+
+
+@njit(cache=True, fastmath=_FASTMATH_FLAGS, error_model="numpy", nogil=True)
+def conventional_preload_kernel(torque, screw_diameter, k_factor):
+    """Conventional estimate: F = T / (K * d)"""
+    return torque / (k_factor * screw_diameter)
+
+
+@njit(cache=True, fastmath=_FASTMATH_FLAGS, error_model="numpy", nogil=True)
+def stress_kernel(preload, tensile_area):
+    """Stress: σ = F / A_t"""
+    return preload / tensile_area
+
+
+@njit(cache=True, fastmath=_FASTMATH_FLAGS, error_model="numpy", nogil=True)
+def tensile_area_kernel(nominal_diameter, thread_pitch):
+    """Tensile stress area: A_t = (π/4) * (d - 0.9382*p)²"""
+    effective_diameter = nominal_diameter - _THREAD_COEFF * thread_pitch
+    return _PI_4 * effective_diameter * effective_diameter
+
+
+@njit(cache=True, fastmath=_FASTMATH_FLAGS, error_model="numpy", nogil=True)
+def safety_factor_kernel(stress, yield_strength):
+    """Safety factor: SF = yield strength / stress"""
+    return yield_strength / stress
+
+
+@njit(cache=True, fastmath=_FASTMATH_FLAGS, error_model="numpy", nogil=True)
+def safety_factor_from_torques_kernel(tightening_torque, removal_torque, thread_pitch,
+                                      tensile_area, yield_strength):
+    """Fused preload, stress and safety factor: SF = yield strength * A_t * p / ((Tt - Tr) * π)"""
+    return yield_strength * tensile_area * thread_pitch * _INV_PI / (tightening_torque - removal_torque)
+
+
+@vectorize(nopython=True, cache=True)
+def preload_range_min_kernel(preload, uncertainty_percent):
+    """Lower bound of the preload range: P - P * u/100"""
+    return preload - preload * (uncertainty_percent * 0.01)
+
+
+@vectorize(nopython=True, cache=True)
+def preload_range_max_kernel(preload, uncertainty_percent):
+    """Upper bound of the preload range: P + P * u/100"""
+    return preload + preload * (uncertainty_percent * 0.01)
+
+
+@njit(cache=True, error_model="numpy", nogil=True)
+def risk_code_kernel(safety_factor, min_safety_factor):
+    """Risk level code matching assess_risk: 0 = Low, 1 = Medium, 2 = High"""
+    if safety_factor > 3.0:
+        return 0
+    elif safety_factor >= min_safety_factor:
+        return 1
+    return 2
+
+
+@njit(cache=True, fastmath=_FASTMATH_FLAGS, error_model="numpy", nogil=True)
+def implant_analysis_kernel(torque, diameter, thread_pitch, k_factor, yield_strength,
+                            removal_factor, min_safety_factor):
+    """
+    Fused preload, stress, safety factor and risk calculation for many screws.
+    
+    Diameters and thread pitches are in mm. Returns the conventional and
+    Wadhwani-Hess preloads, stresses and safety factors, followed by the
+    int8 risk codes for both methods.
+    """
+    n = torque.shape[0]
+    conv_preload = np.empty(n)
+    wh_preload = np.empty(n)
+    conv_stress = np.empty(n)
+    wh_stress = np.empty(n)
+    conv_safety = np.empty(n)
+    wh_safety = np.empty(n)
+    conv_risk = np.empty(n, dtype=np.int8)
+    wh_risk = np.empty(n, dtype=np.int8)
+    
+    for i in range(n):
+        effective_diameter = diameter[i] - _THREAD_COEFF * thread_pitch[i]
+        tensile_area = _PI_4 * effective_diameter * effective_diameter
+        
+        conv_preload[i] = torque[i] / (k_factor[i] * (diameter[i] / 10))
+        wh_preload[i] = (torque[i] - torque[i] * removal_factor) * _PI / (thread_pitch[i] / 10)
+        
+        conv_stress[i] = conv_preload[i] / tensile_area
+        wh_stress[i] = wh_preload[i] / tensile_area
+        
+        conv_safety[i] = yield_strength[i] / conv_stress[i]
+        wh_safety[i] = yield_strength[i] / wh_stress[i]
+        
+        conv_risk[i] = risk_code_kernel(conv_safety[i], min_safety_factor)
+        wh_risk[i] = risk_code_kernel(wh_safety[i], min_safety_factor)
+    
+    return conv_preload, wh_preload, conv_stress, wh_stress, conv_safety, wh_safety, conv_risk, wh_risk
+
+
+def warm_up():
+    """Compile (or load from the on-disk cache) every kernel for float64 arguments."""
+    preload_kernel(35.0, 29.5, 0.04)
+    final_torque_kernel(25.0, 21.4, 400.0, 0.04)
+    self_loosening_kernel(35.0, 29.5)
+    primary_locking_kernel(35.0, 29.5)
+    conventional_preload_kernel(35.0, 0.2, 0.2)
+    stress_kernel(400.0, 2.0)
+    tensile_area_kernel(2.0, 0.4)
+    safety_factor_kernel(400.0, 950.0)
+    safety_factor_from_torques_kernel(35.0, 29.5, 0.04, 2.0, 950.0)
+    preload_range_min_kernel(400.0, 9.0)
+    preload_range_max_kernel(400.0, 9.0)
+    
+    screws = np.array([2.0])
+    implant_analysis_kernel(screws * 17.5, screws, screws * 0.2, screws * 0.1,
+                            screws * 475.0, 0.85, 1.5)
+
+
+if __name__ == "__main__":
+    warm_up()
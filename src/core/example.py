@@ -8,11 +8,17 @@ preload, final torque, self-loosening, and primary locking.
 
 import sys
 import math
-import json
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+import orjson
+
 # Add the src directory to the Python path
-sys.path.append(str(Path(__file__).parent.parent.parent))
+_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.append(str(_ROOT))
 
 # Import the preload calculation modules
 from src.core.preload import (
@@ -21,18 +27,45 @@ from src.core.preload import (
     calculate_self_loosening,
     calculate_primary_locking,
     estimate_uncertainty,
-    calculate_preload_range
+    calculate_preload_range,
+    calculate_preload_batch
 )
 
 # Import torque calculation modules
 from src.core.torque import (
     estimate_preload_from_torque,
-    calculate_stress_from_preload,
-    calculate_safety_factor,
-    calculate_tensile_area,
-    assess_risk
+    estimate_preload_from_torque_batch,
+    calculate_stress_from_preload_batch,
+    calculate_safety_factor_batch,
+    calculate_tensile_area_batch,
+    assess_risk_batch,
+    RISK_LEVELS
+)
+
+_PI = math.pi
+
+# Risk levels for the conventional example: a safety factor above a threshold moves up one level
+_CONVENTIONAL_RISK_THRESHOLDS = (1.0, 1.5, 2.5)
+_CONVENTIONAL_RISK_LEVELS = (
+    ("Critical", "NOT SAFE FOR USE. Redesign required."),
+    ("High", "Use with caution and frequent monitoring."),
+    ("Medium", "Safe for use, but consider more frequent check-ups."),
+    ("Low", "Safe for long-term use with standard maintenance.")
 )
 
+# Sample implant systems database
+SAMPLE_SYSTEMS_PATH = Path(__file__).parent.parent.parent / "data" / "implant_systems" / "sample_systems.json"
+
+
+@lru_cache(maxsize=None)
+def load_implant_data(path=str(SAMPLE_SYSTEMS_PATH)):
+    """
+    Load an implant systems database, parsing each file only once.
+    
+    The returned dictionary is shared between callers and must not be modified.
+    """
+    return orjson.loads(Path(path).read_bytes())
+
 
 def example_wadhwani_hess_method():
     """
@@ -41,9 +74,10 @@ def example_wadhwani_hess_method():
     This example uses the data from the paper to demonstrate the calculation
     of initial preload, final torque, self-loosening, and primary locking.
     """
-    print("=" * 50)
-    print("WADHWANI-HESS METHOD EXAMPLE")
-    print("=" * 50)
+    lines = []  # Output lines, printed together at the end
+    lines.append("=" * 50)
+    lines.append("WADHWANI-HESS METHOD EXAMPLE")
+    lines.append("=" * 50)
     
     # Example data from the paper
     initial_torque = 25  # N-cm
@@ -70,35 +104,38 @@ def example_wadhwani_hess_method():
     primary_locking = calculate_primary_locking(initial_torque, removal_torque)
     
     # Print the results
-    print(f"Initial torque: {initial_torque} N-cm")
-    print(f"Removal torque: {removal_torque} N-cm")
-    print(f"Initial preload: {initial_preload:.2f} N")
-    print(f"Desired preload: {desired_preload} N")
-    print(f"Final torque required (exact method): {final_torque:.2f} N-cm")
-    print(f"Final torque required (ratio method): {final_torque_ratio:.2f} N-cm")
-    print(f"Self-loosening: {self_loosening:.2f} N-cm")
-    print(f"Primary locking: {primary_locking:.2f} N-cm")
-    print()
+    lines.append(f"Initial torque: {initial_torque} N-cm")
+    lines.append(f"Removal torque: {removal_torque} N-cm")
+    lines.append(f"Initial preload: {initial_preload:.2f} N")
+    lines.append(f"Desired preload: {desired_preload} N")
+    lines.append(f"Final torque required (exact method): {final_torque:.2f} N-cm")
+    lines.append(f"Final torque required (ratio method): {final_torque_ratio:.2f} N-cm")
+    lines.append(f"Self-loosening: {self_loosening:.2f} N-cm")
+    lines.append(f"Primary locking: {primary_locking:.2f} N-cm")
+    lines.append("")
     
     # Show formula details
-    print("FORMULA DETAILS:")
-    print("Preload (Equation 3): P = (Tt - Tr) * π / p")
-    preload_manual = (initial_torque - removal_torque) * math.pi / thread_pitch
-    print(f"  = ({initial_torque} - {removal_torque}) * π / {thread_pitch}")
-    print(f"  = {preload_manual:.2f} N")
-    print()
-    
-    print("Final Torque (Equation 6): Ti = (p * Tt * P_desired) / (π * (Tt - Tr))")
-    torque_manual = (thread_pitch * initial_torque * desired_preload) / (math.pi * (initial_torque - removal_torque))
-    print(f"  = ({thread_pitch} * {initial_torque} * {desired_preload}) / (π * ({initial_torque} - {removal_torque}))")
-    print(f"  = {torque_manual:.2f} N-cm")
-    print()
-    
-    print("Ratio Method: Ti = Tt * (P_desired / P_initial)")
+    lines.append("FORMULA DETAILS:")
+    lines.append("Preload (Equation 3): P = (Tt - Tr) * π / p")
+    torque_difference = initial_torque - removal_torque
+    preload_manual = torque_difference * _PI / thread_pitch
+    lines.append(f"  = ({initial_torque} - {removal_torque}) * π / {thread_pitch}")
+    lines.append(f"  = {preload_manual:.2f} N")
+    lines.append("")
+    
+    lines.append("Final Torque (Equation 6): Ti = (p * Tt * P_desired) / (π * (Tt - Tr))")
+    torque_manual = (thread_pitch * initial_torque * desired_preload) / (_PI * torque_difference)
+    lines.append(f"  = ({thread_pitch} * {initial_torque} * {desired_preload}) / (π * ({initial_torque} - {removal_torque}))")
+    lines.append(f"  = {torque_manual:.2f} N-cm")
+    lines.append("")
+    
+    lines.append("Ratio Method: Ti = Tt * (P_desired / P_initial)")
     ratio_manual = initial_torque * (desired_preload / initial_preload)
-    print(f"  = {initial_torque} * ({desired_preload} / {initial_preload:.2f})")
-    print(f"  = {ratio_manual:.2f} N-cm")
-    print()
+    lines.append(f"  = {initial_torque} * ({desired_preload} / {initial_preload:.2f})")
+    lines.append(f"  = {ratio_manual:.2f} N-cm")
+    lines.append("")
+    
+    print("\n".join(lines))
 
 
 def example_conventional_method():
@@ -108,9 +145,10 @@ def example_conventional_method():
     This example demonstrates the calculation of estimated preload,
     stress, safety factor, and risk assessment.
     """
-    print("=" * 50)
-    print("CONVENTIONAL METHOD EXAMPLE")
-    print("=" * 50)
+    lines = []  # Output lines, printed together at the end
+    lines.append("=" * 50)
+    lines.append("CONVENTIONAL METHOD EXAMPLE")
+    lines.append("=" * 50)
     
     # Example data
     nominal_torque = 35  # N-cm
@@ -121,7 +159,7 @@ def example_conventional_method():
     # Calculate tensile area (approximate)
     # Using the formula: A_t = π/4 * (d - 0.9382*p)^2
     tensile_diameter = screw_diameter - 0.9382 * thread_pitch
-    tensile_area = math.pi/4 * tensile_diameter**2
+    tensile_area = _PI/4 * tensile_diameter**2
     tensile_area_mm2 = tensile_area * 100  # convert from cm² to mm²
     
     # Estimate preload using conventional method (T = K*d*F)
@@ -137,31 +175,22 @@ def example_conventional_method():
     safety_factor = yield_strength / stress_mpa
     
     # Assess risk level
-    if safety_factor > 2.5:
-        risk_level = "Low"
-        recommendation = "Safe for long-term use with standard maintenance."
-    elif safety_factor > 1.5:
-        risk_level = "Medium"
-        recommendation = "Safe for use, but consider more frequent check-ups."
-    elif safety_factor > 1.0:
-        risk_level = "High"
-        recommendation = "Use with caution and frequent monitoring."
-    else:
-        risk_level = "Critical"
-        recommendation = "NOT SAFE FOR USE. Redesign required."
+    risk_level, recommendation = _CONVENTIONAL_RISK_LEVELS[bisect_left(_CONVENTIONAL_RISK_THRESHOLDS, safety_factor)]
     
     # Print results
-    print(f"Nominal torque: {nominal_torque} N-cm")
-    print(f"Screw diameter: {screw_diameter} cm")
-    print(f"Thread pitch: {thread_pitch} cm")
-    print(f"Tensile area: {tensile_area_mm2:.2f} mm²")
-    print(f"Estimated preload: {estimated_preload:.2f} N")
-    print(f"Stress: {stress_mpa:.2f} MPa")
-    print(f"Yield strength: {yield_strength} MPa")
-    print(f"Safety factor: {safety_factor:.2f}")
-    print(f"Risk level: {risk_level}")
-    print(f"Recommendation: {recommendation}")
-    print()
+    lines.append(f"Nominal torque: {nominal_torque} N-cm")
+    lines.append(f"Screw diameter: {screw_diameter} cm")
+    lines.append(f"Thread pitch: {thread_pitch} cm")
+    lines.append(f"Tensile area: {tensile_area_mm2:.2f} mm²")
+    lines.append(f"Estimated preload: {estimated_preload:.2f} N")
+    lines.append(f"Stress: {stress_mpa:.2f} MPa")
+    lines.append(f"Yield strength: {yield_strength} MPa")
+    lines.append(f"Safety factor: {safety_factor:.2f}")
+    lines.append(f"Risk level: {risk_level}")
+    lines.append(f"Recommendation: {recommendation}")
+    lines.append("")
+    
+    print("\n".join(lines))
 
 
 def example_compare_methods():
@@ -171,9 +200,10 @@ def example_compare_methods():
     This example demonstrates the improved accuracy of the
     Wadhwani-Hess method over the conventional method.
     """
-    print("=" * 50)
-    print("COMPARISON OF METHODS")
-    print("=" * 50)
+    lines = []  # Output lines, printed together at the end
+    lines.append("=" * 50)
+    lines.append("COMPARISON OF METHODS")
+    lines.append("=" * 50)
     
     # Example data
     nominal_torque = 35  # N-cm
@@ -192,24 +222,26 @@ def example_compare_methods():
     wh_preload = calculate_preload(nominal_torque, removal_torque, thread_pitch)
     
     # Print results
-    print("Conventional Method:")
-    print(f"  Estimated preload: {conventional_preload:.2f} N")
-    print(f"  Uncertainty: +/- {uncertainty_percent}%")
-    print(f"  Preload range: {min_preload:.2f} - {max_preload:.2f} N")
-    print()
-    
-    print("Wadhwani-Hess Method:")
-    print(f"  Calculated preload: {wh_preload:.2f} N")
-    print(f"  Uncertainty: +/- 9% (from paper)")
-    print(f"  Preload range: {wh_preload*0.91:.2f} - {wh_preload*1.09:.2f} N")
-    print()
-    
-    print("Conclusion:")
+    lines.append("Conventional Method:")
+    lines.append(f"  Estimated preload: {conventional_preload:.2f} N")
+    lines.append(f"  Uncertainty: +/- {uncertainty_percent}%")
+    lines.append(f"  Preload range: {min_preload:.2f} - {max_preload:.2f} N")
+    lines.append("")
+    
+    lines.append("Wadhwani-Hess Method:")
+    lines.append(f"  Calculated preload: {wh_preload:.2f} N")
+    lines.append(f"  Uncertainty: +/- 9% (from paper)")
+    lines.append(f"  Preload range: {wh_preload*0.91:.2f} - {wh_preload*1.09:.2f} N")
+    lines.append("")
+    
+    lines.append("Conclusion:")
     in_range = min_preload <= wh_preload <= max_preload
-    print(f"  Wadhwani-Hess preload {'is' if in_range else 'is not'} within the conventional method range.")
-    print(f"  The uncertainty is reduced by {uncertainty_percent - 9}% compared to the conventional method.")
-    print(f"  This confirms the improved accuracy of the Wadhwani-Hess method.")
-    print()
+    lines.append(f"  Wadhwani-Hess preload {'is' if in_range else 'is not'} within the conventional method range.")
+    lines.append(f"  The uncertainty is reduced by {uncertainty_percent - 9}% compared to the conventional method.")
+    lines.append(f"  This confirms the improved accuracy of the Wadhwani-Hess method.")
+    lines.append("")
+    
+    print("\n".join(lines))
 
 
 def example_implant_systems():
@@ -219,65 +251,71 @@ def example_implant_systems():
     This example demonstrates preload and stress calculations for
     different dental implant systems using data from the sample_systems.json file.
     """
-    print("=" * 50)
-    print("IMPLANT SYSTEMS COMPARISON")
-    print("=" * 50)
+    lines = []  # Output lines, printed together at the end
+    lines.append("=" * 50)
+    lines.append("IMPLANT SYSTEMS COMPARISON")
+    lines.append("=" * 50)
     
     # Load implant systems data
-    data_path = Path(__file__).parent.parent.parent / "data" / "implant_systems" / "sample_systems.json"
-    
-    with open(data_path, 'r') as f:
-        implant_data = json.load(f)
+    implant_data = load_implant_data()
     
     systems = implant_data["implant_systems"]
     
     # Set up comparison table headers
-    print(f"{'Implant System':<25} {'Conv. Preload':<15} {'W-H Preload':<15} {'Safety Factor':<15} {'Risk Level':<10}")
-    print("-" * 80)
+    lines.append(f"{'Implant System':<25} {'Conv. Preload':<15} {'W-H Preload':<15} {'Safety Factor':<15} {'Risk Level':<10}")
+    lines.append("-" * 80)
     
     # Assume removal torque is 85% of tightening torque
     removal_torque_factor = 0.85
     
+    # Flatten the screw data of every model into columns
+    names = []
+    screws = []
     for system_name, system_data in systems.items():
         for model_name, model_data in system_data.items():
-            # Get screw data
             screw_data = model_data["screws"]["standard"]
-            
-            # Get parameters
-            torque = screw_data["recommended_torque"]  # N-cm
-            diameter = screw_data["diameter"] / 10  # mm to cm
-            thread_pitch = screw_data["thread_pitch"] / 10  # mm to cm
-            k_factor = screw_data["K_factor"]
-            yield_strength = screw_data["yield_strength"]  # MPa
-            
-            # Calculate tensile area
-            tensile_area = calculate_tensile_area(screw_data["diameter"], screw_data["thread_pitch"])
-            
-            # Calculate preload using conventional method
-            conventional_preload = estimate_preload_from_torque(torque, diameter, k_factor)
-            
-            # Calculate stress and safety factor
-            stress = calculate_stress_from_preload(conventional_preload, tensile_area)
-            safety_factor = calculate_safety_factor(stress, yield_strength)
-            
-            # Get risk level
-            risk_level, _ = assess_risk(safety_factor)
-            
-            # Calculate preload using Wadhwani-Hess method
-            removal_torque = torque * removal_torque_factor
-            wh_preload = calculate_preload(torque, removal_torque, thread_pitch)
-            
-            # Print results in table format
-            print(f"{system_name + ' ' + model_name:<25} {conventional_preload:>10.2f} N    {wh_preload:>10.2f} N    {safety_factor:>10.2f}    {risk_level:<10}")
-    
-    print()
-    print("Notes:")
-    print("1. Conventional preload calculated using T = K*d*F formula")
-    print("2. Wadhwani-Hess preload calculated using P = (Tt - Tr) * π / p")
-    print("3. Removal torque estimated as 85% of tightening torque")
-    print("4. Safety factor calculated as Yield Strength / Stress")
-    print("5. Risk levels: Low (SF > 3.0), Medium (1.5 < SF ≤ 3.0), High (SF ≤ 1.5)")
-    print()
+            names.append(system_name + ' ' + model_name)
+            screws.append((
+                screw_data["recommended_torque"],  # N-cm
+                screw_data["diameter"],  # mm
+                screw_data["thread_pitch"],  # mm
+                screw_data["K_factor"],
+                screw_data["yield_strength"]  # MPa
+            ))
+    
+    torque, diameter_mm, thread_pitch_mm, k_factor, yield_strength = np.array(screws, dtype=np.float64).T
+    
+    # Calculate tensile area
+    tensile_area = calculate_tensile_area_batch(diameter_mm, thread_pitch_mm)
+    
+    # Calculate preload using conventional method
+    conventional_preload = estimate_preload_from_torque_batch(torque, diameter_mm / 10, k_factor)
+    
+    # Calculate stress and safety factor
+    stress = calculate_stress_from_preload_batch(conventional_preload, tensile_area)
+    safety_factor = calculate_safety_factor_batch(stress, yield_strength)
+    
+    # Get risk level
+    risk_code = assess_risk_batch(safety_factor)
+    
+    # Calculate preload using Wadhwani-Hess method
+    removal_torque = torque * removal_torque_factor
+    wh_preload = calculate_preload_batch(torque, removal_torque, thread_pitch_mm / 10)
+    
+    # Print results in table format
+    for i, name in enumerate(names):
+        lines.append(f"{name:<25} {conventional_preload[i]:>10.2f} N    {wh_preload[i]:>10.2f} N    {safety_factor[i]:>10.2f}    {RISK_LEVELS[risk_code[i]]:<10}")
+    
+    lines.append("")
+    lines.append("Notes:")
+    lines.append("1. Conventional preload calculated using T = K*d*F formula")
+    lines.append("2. Wadhwani-Hess preload calculated using P = (Tt - Tr) * π / p")
+    lines.append("3. Removal torque estimated as 85% of tightening torque")
+    lines.append("4. Safety factor calculated as Yield Strength / Stress")
+    lines.append("5. Risk levels: Low (SF > 3.0), Medium (1.5 < SF ≤ 3.0), High (SF ≤ 1.5)")
+    lines.append("")
+    
+    print("\n".join(lines))
 
 
 def main():
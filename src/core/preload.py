@@ -20,8 +20,41 @@ Where:
 - P_desired: Desired preload (N)
 """
 
-import math
-from typing import Tuple, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, NamedTuple, Tuple, Optional
+
+import numpy as np
+
+from ._kernels import (
+    preload_kernel,
+    final_torque_kernel,
+    self_loosening_kernel,
+    primary_locking_kernel,
+    preload_range_min_kernel,
+    preload_range_max_kernel
+)
+from .torque import (
+    _UNCERTAINTY_PERCENT_TABLE,
+    calculate_stress_from_preload_batch,
+    calculate_safety_factor_batch,
+    assess_risk_batch
+)
+
+_PI = np.pi
+_INV_PI = 1.0 / np.pi
+
+
+class Uncertainty(NamedTuple):
+    """Conventional preload uncertainty as (percent, value)."""
+    percent: int
+    value: float
+
+
+class PreloadRange(NamedTuple):
+    """Minimum and maximum preload (N)."""
+    min: float
+    max: float
 
 
 def calculate_preload(tightening_torque: float, removal_torque: float, thread_pitch: float) -> float:
@@ -43,7 +76,76 @@ def calculate_preload(tightening_torque: float, removal_torque: float, thread_pi
         raise ValueError("Thread pitch must be greater than zero")
         
     # Equation 3: P = (Tt - Tr) * π / p
-    return (tightening_torque - removal_torque) * math.pi / thread_pitch
+    return (tightening_torque - removal_torque) * _PI / thread_pitch
+
+
+def calculate_preload_batch(
+    tightening_torque,
+    removal_torque,
+    thread_pitch,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Calculate the preload for many screws at once (vectorized Equation 3).
+    
+    Arguments may be scalars or arrays and are broadcast against each other.
+    
+    Args:
+        tightening_torque: The initial tightening torques (N-cm)
+        removal_torque: The measured removal torques (N-cm)
+        thread_pitch: The thread pitches of the screws (cm)
+        out: Optional float64 array of the broadcast shape to write the preloads
+            into, so a caller evaluating many batches can reuse one buffer
+        
+    Returns:
+        np.ndarray: The calculated preloads (N)
+        
+    Raises:
+        ValueError: If any thread_pitch is less than or equal to zero
+    """
+    tightening_torque = np.asarray(tightening_torque, dtype=np.float64)
+    removal_torque = np.asarray(removal_torque, dtype=np.float64)
+    thread_pitch = np.asarray(thread_pitch, dtype=np.float64)
+    
+    if np.any(thread_pitch <= 0):
+        raise ValueError("Thread pitch must be greater than zero")
+    
+    if out is not None:
+        np.subtract(tightening_torque, removal_torque, out=out)
+        np.multiply(out, _PI, out=out)
+        return np.divide(out, thread_pitch, out=out)
+    
+    return preload_kernel(tightening_torque, removal_torque, thread_pitch)
+
+
+def make_preload_calculator(thread_pitch: float) -> Callable[[float, float], float]:
+    """
+    Create a preload calculator specialized for one thread pitch.
+    
+    The returned function computes Equation 3 with π / p precomputed, so
+    repeated calls at the same pitch cost one subtraction and one
+    multiplication.
+    
+    Args:
+        thread_pitch: The thread pitch of the screw (cm)
+        
+    Returns:
+        Callable[[float, float], float]: A function of (tightening_torque, removal_torque)
+        returning the preload (N)
+        
+    Raises:
+        ValueError: If thread_pitch is less than or equal to zero
+    """
+    if thread_pitch <= 0:
+        raise ValueError("Thread pitch must be greater than zero")
+    
+    k = _PI / thread_pitch
+    
+    def preload_at_pitch(tightening_torque: float, removal_torque: float) -> float:
+        # Equation 3 with k = π / p
+        return (tightening_torque - removal_torque) * k
+    
+    return preload_at_pitch
 
 
 def calculate_final_torque(
@@ -81,13 +183,87 @@ def calculate_final_torque(
     if initial_torque <= removal_torque:
         raise ValueError("Initial torque must be greater than removal torque")
     
-    # Simple ratio method (mathematically equivalent to Equation 6 when using Wadhwani-Hess preload formula)
-    ratio_method = initial_torque * (desired_preload / initial_preload)
+    if use_ratio_method:
+        # Simple ratio method (mathematically equivalent to Equation 6 when using Wadhwani-Hess preload formula)
+        return initial_torque * (desired_preload / initial_preload)
     
     # Equation 6: Ti = (p * Tt * P_desired) / (π * (Tt - Tr))
-    exact_method = (thread_pitch * initial_torque * desired_preload) / (math.pi * (initial_torque - removal_torque))
+    return thread_pitch * initial_torque * desired_preload * _INV_PI / (initial_torque - removal_torque)
+
+
+def calculate_final_torque_batch(
+    initial_torque,
+    removal_torque,
+    initial_preload,
+    desired_preload,
+    thread_pitch,
+    use_ratio_method: bool = False
+) -> np.ndarray:
+    """
+    Calculate the final tightening torque for many screws at once (vectorized Equation 6).
+    
+    Arguments may be scalars or arrays and are broadcast against each other.
+    
+    Args:
+        initial_torque: The initial tightening torques (N-cm)
+        removal_torque: The measured removal torques (N-cm)
+        initial_preload: The initial preloads calculated from initial_torque and removal_torque
+        desired_preload: The desired final preloads (N)
+        thread_pitch: The thread pitches of the screws (cm)
+        use_ratio_method: Whether to use the ratio method instead of Equation 6 (default: False)
+        
+    Returns:
+        np.ndarray: The calculated final tightening torques (N-cm)
+        
+    Raises:
+        ValueError: If any thread_pitch is less than or equal to zero or if any
+                   initial_torque is less than or equal to its removal_torque
+    """
+    initial_torque = np.asarray(initial_torque, dtype=np.float64)
+    removal_torque = np.asarray(removal_torque, dtype=np.float64)
+    desired_preload = np.asarray(desired_preload, dtype=np.float64)
+    thread_pitch = np.asarray(thread_pitch, dtype=np.float64)
+    
+    if np.any(thread_pitch <= 0):
+        raise ValueError("Thread pitch must be greater than zero")
+        
+    if np.any(initial_torque <= removal_torque):
+        raise ValueError("Initial torque must be greater than removal torque")
+    
+    if use_ratio_method:
+        return initial_torque * (desired_preload / np.asarray(initial_preload, dtype=np.float64))
+    
+    return final_torque_kernel(initial_torque, removal_torque, desired_preload, thread_pitch)
+
+
+def make_final_torque_calculator(thread_pitch: float) -> Callable[[float, float, float], float]:
+    """
+    Create a final torque calculator (Equation 6) specialized for one thread pitch.
+    
+    Args:
+        thread_pitch: The thread pitch of the screw (cm)
+        
+    Returns:
+        Callable[[float, float, float], float]: A function of (initial_torque,
+        removal_torque, desired_preload) returning the final tightening torque (N-cm);
+        it raises ValueError if initial_torque is less than or equal to removal_torque
+        
+    Raises:
+        ValueError: If thread_pitch is less than or equal to zero
+    """
+    if thread_pitch <= 0:
+        raise ValueError("Thread pitch must be greater than zero")
     
-    return ratio_method if use_ratio_method else exact_method
+    k = thread_pitch * _INV_PI
+    
+    def final_torque_at_pitch(initial_torque: float, removal_torque: float, desired_preload: float) -> float:
+        if initial_torque <= removal_torque:
+            raise ValueError("Initial torque must be greater than removal torque")
+        
+        # Equation 6 with k = p / π
+        return initial_torque * desired_preload * k / (initial_torque - removal_torque)
+    
+    return final_torque_at_pitch
 
 
 def calculate_self_loosening(tightening_torque: float, removal_torque: float) -> float:
@@ -103,7 +279,7 @@ def calculate_self_loosening(tightening_torque: float, removal_torque: float) ->
     Returns:
         float: The calculated self-loosening torque (N-cm)
     """
-    return (tightening_torque - removal_torque) / 2
+    return (tightening_torque - removal_torque) * 0.5
 
 
 def calculate_primary_locking(tightening_torque: float, removal_torque: float) -> float:
@@ -119,10 +295,67 @@ def calculate_primary_locking(tightening_torque: float, removal_torque: float) -
     Returns:
         float: The calculated primary locking torque (N-cm)
     """
-    return (tightening_torque + removal_torque) / 2
+    return (tightening_torque + removal_torque) * 0.5
+
+
+def calculate_torque_components_batch(tightening_torque, removal_torque) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the self-loosening and primary locking components for many screws at once.
+    
+    Arguments may be scalars or arrays and are broadcast against each other.
+    
+    Args:
+        tightening_torque: The tightening torques (N-cm)
+        removal_torque: The removal torques (N-cm)
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: A tuple containing (self_loosening, primary_locking)
+    """
+    tightening_torque = np.asarray(tightening_torque, dtype=np.float64)
+    removal_torque = np.asarray(removal_torque, dtype=np.float64)
+    
+    return (
+        self_loosening_kernel(tightening_torque, removal_torque),
+        primary_locking_kernel(tightening_torque, removal_torque)
+    )
+
+
+def calculate_preload_components(
+    tightening_torque: float,
+    removal_torque: float,
+    thread_pitch: float
+) -> Tuple[float, float, float]:
+    """
+    Calculate the preload together with the self-loosening and primary locking components.
+    
+    Equivalent to calling calculate_preload, calculate_self_loosening and
+    calculate_primary_locking, but shares the torque difference between them.
+    
+    Args:
+        tightening_torque: The initial tightening torque (N-cm)
+        removal_torque: The measured removal torque (N-cm)
+        thread_pitch: The thread pitch of the screw (cm)
+        
+    Returns:
+        Tuple[float, float, float]: A tuple containing (preload, self_loosening, primary_locking)
+        
+    Raises:
+        ValueError: If thread_pitch is less than or equal to zero
+    """
+    if thread_pitch <= 0:
+        raise ValueError("Thread pitch must be greater than zero")
+    
+    torque_difference = tightening_torque - removal_torque
+    
+    return (
+        torque_difference * _PI / thread_pitch,
+        torque_difference * 0.5,
+        (tightening_torque + removal_torque) * 0.5
+    )
 
 
-def estimate_uncertainty(torque_value: float, is_lubricated: bool = False) -> Tuple[int, float]:
+@lru_cache(maxsize=1024)
+def estimate_uncertainty(torque_value: float, is_lubricated: bool = False) -> Uncertainty:
     """
     Estimate the uncertainty in preload for conventional calculation methods.
     
@@ -135,15 +368,38 @@ def estimate_uncertainty(torque_value: float, is_lubricated: bool = False) -> Tu
         is_lubricated: Whether the screw is lubricated
         
     Returns:
-        Tuple[int, float]: A tuple containing (uncertainty_percentage, uncertainty_value)
+        Uncertainty: A named tuple containing (uncertainty_percentage, uncertainty_value)
     """
     uncertainty_percent = 25 if is_lubricated else 35
     uncertainty_value = (uncertainty_percent / 100) * torque_value
     
-    return uncertainty_percent, uncertainty_value
+    return Uncertainty(uncertainty_percent, uncertainty_value)
 
 
-def calculate_preload_range(preload: float, uncertainty_percent: float) -> Tuple[float, float]:
+def estimate_uncertainty_batch(torque_value, is_lubricated=False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Estimate the conventional preload uncertainty for many screws at once.
+    
+    Arguments may be scalars or arrays and are broadcast against each other.
+    The percentages can be passed straight to calculate_preload_range_batch.
+    
+    Args:
+        torque_value: The torque values (N-cm)
+        is_lubricated: Whether each screw is lubricated
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: A tuple containing the int8 uncertainty
+        percentages and the float64 uncertainty values
+    """
+    torque_value, is_lubricated = np.broadcast_arrays(
+        np.asarray(torque_value, dtype=np.float64), np.asarray(is_lubricated, dtype=bool)
+    )
+    uncertainty_percent = _UNCERTAINTY_PERCENT_TABLE[is_lubricated.view(np.int8)]
+    
+    return uncertainty_percent, uncertainty_percent / 100 * torque_value
+
+
+def calculate_preload_range(preload: float, uncertainty_percent: float) -> PreloadRange:
     """
     Calculate the min and max preload based on uncertainty percentage.
     
@@ -152,10 +408,95 @@ def calculate_preload_range(preload: float, uncertainty_percent: float) -> Tuple
         uncertainty_percent: The uncertainty percentage
         
     Returns:
-        Tuple[float, float]: A tuple containing (min_preload, max_preload)
+        PreloadRange: A named tuple containing (min_preload, max_preload)
+    """
+    delta = preload * (uncertainty_percent * 0.01)
+    
+    return PreloadRange(preload - delta, preload + delta)
+
+
+def calculate_preload_range_batch(preload, uncertainty_percent) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the min and max preload for many preloads or uncertainties at once.
+    
+    Arguments may be scalars or arrays and are broadcast against each other,
+    e.g. one preload against a sweep of uncertainty percentages.
+    
+    Args:
+        preload: The estimated preloads (N)
+        uncertainty_percent: The uncertainty percentages
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: A tuple containing (min_preloads, max_preloads)
     """
-    uncertainty_factor = uncertainty_percent / 100
-    min_preload = preload * (1 - uncertainty_factor)
-    max_preload = preload * (1 + uncertainty_factor)
+    preload = np.asarray(preload, dtype=np.float64)
+    uncertainty_percent = np.asarray(uncertainty_percent, dtype=np.float64)
     
-    return min_preload, max_preload 
\ No newline at end of file
+    return (
+        preload_range_min_kernel(preload, uncertainty_percent),
+        preload_range_max_kernel(preload, uncertainty_percent)
+    )
+
+
+@dataclass
+class PreloadBatch:
+    """
+    Preloads, preload ranges and risk codes for many screws, one array per field.
+    
+    Attributes:
+        nominal: The calculated preloads (N)
+        min: The lower bounds of the preload ranges (N)
+        max: The upper bounds of the preload ranges (N)
+        risk_code: The int8 risk codes from assess_risk_batch (0 = Low, 1 = Medium, 2 = High)
+    """
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10
+    __slots__ = ("nominal", "min", "max", "risk_code")
+    
+    nominal: np.ndarray
+    min: np.ndarray
+    max: np.ndarray
+    risk_code: np.ndarray
+    
+    @classmethod
+    def from_torques(
+        cls,
+        tightening_torque,
+        removal_torque,
+        thread_pitch,
+        uncertainty_percent,
+        tensile_area,
+        yield_strength,
+        min_safety_factor: float = 1.5
+    ) -> "PreloadBatch":
+        """
+        Calculate the preloads, ranges and risk codes from measured torques.
+        
+        Arguments may be scalars or arrays and are broadcast against each other.
+        
+        Args:
+            tightening_torque: The initial tightening torques (N-cm)
+            removal_torque: The measured removal torques (N-cm)
+            thread_pitch: The thread pitches of the screws (cm)
+            uncertainty_percent: The uncertainty percentages of the preloads
+            tensile_area: The tensile stress areas of the screws (mm²)
+            yield_strength: The yield strengths of the screw materials (MPa)
+            min_safety_factor: The minimum acceptable safety factor
+            
+        Returns:
+            PreloadBatch: The preloads, preload ranges and risk codes
+            
+        Raises:
+            ValueError: If any thread pitch, tensile area or yield strength is
+                not positive, or a preload is not positive
+        """
+        nominal = calculate_preload_batch(tightening_torque, removal_torque, thread_pitch)
+        min_preload, max_preload = calculate_preload_range_batch(nominal, uncertainty_percent)
+        stress = calculate_stress_from_preload_batch(nominal, tensile_area)
+        safety_factor = calculate_safety_factor_batch(stress, yield_strength)
+        
+        return cls(
+            nominal,
+            min_preload,
+            max_preload,
+            assess_risk_batch(safety_factor, min_safety_factor)
+        )
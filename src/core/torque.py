@@ -9,8 +9,105 @@ This module implements torque-related calculations, including:
 - Risk assessment
 """
 
-import math
-from typing import Union, Tuple, Dict, List, Optional
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Callable, NamedTuple, Union, Tuple, Dict, List, Optional
+
+import numpy as np
+
+from ._kernels import (
+    conventional_preload_kernel,
+    stress_kernel,
+    safety_factor_kernel,
+    safety_factor_from_torques_kernel,
+    tensile_area_kernel,
+    implant_analysis_kernel,
+    preload_range_min_kernel,
+    preload_range_max_kernel
+)
+
+_INV_PI = 1.0 / np.pi
+_PI_4 = np.pi * 0.25
+_THREAD_COEFF = 0.9382  # Tensile stress area pitch coefficient (ISO 898-1)
+
+# Conventional uncertainty percentage indexed by is_lubricated (0 = unlubricated, 1 = lubricated)
+_UNCERTAINTY_PERCENT_TABLE = np.array([35, 25], dtype=np.int8)
+
+# Risk level for each risk code returned by assess_risk_batch
+RISK_LEVELS = ("Low", "Medium", "High")
+
+
+class RiskAssessment(NamedTuple):
+    """Risk level and recommendation returned by assess_risk."""
+    level: str
+    recommendation: str
+
+
+class TorqueRange(NamedTuple):
+    """Minimum and maximum tightening torque (N-cm)."""
+    min: float
+    max: float
+
+
+class ImplantAnalysis(NamedTuple):
+    """Per-screw results of analyze_implants_batch, one array per field."""
+    conventional_preload: np.ndarray
+    wh_preload: np.ndarray
+    conventional_stress: np.ndarray
+    wh_stress: np.ndarray
+    conventional_safety_factor: np.ndarray
+    wh_safety_factor: np.ndarray
+    conventional_risk_code: np.ndarray
+    wh_risk_code: np.ndarray
+
+
+# Safety factor thresholds for assess_risk: above 3.0 is Low risk, at or above
+# min_safety_factor is Medium, anything else is High. bisect_left counts the
+# thresholds strictly below a safety factor, so the Medium threshold is moved
+# one float below min_safety_factor to count a safety factor equal to it.
+_LOW_RISK_THRESHOLD = 3.0
+_RISK_THRESHOLDS = (float(np.nextafter(1.5, -np.inf)), _LOW_RISK_THRESHOLD)
+
+# assess_risk results indexed by the number of thresholds below the safety factor
+_RISK_RESULTS = (
+    RiskAssessment("High", "Not recommended, consider alternative implant system or reduced loading"),
+    RiskAssessment("Medium", "Safe for use, but consider more frequent check-ups"),
+    RiskAssessment("Low", "Safe for use with standard protocol")
+)
+
+
+@lru_cache(maxsize=64)
+def _risk_thresholds(min_safety_factor: float) -> Tuple[float, float]:
+    """Return the sorted assess_risk thresholds for a minimum safety factor."""
+    if min_safety_factor == 1.5:
+        return _RISK_THRESHOLDS
+    # A minimum above 3.0 leaves no Medium band, so clamp it to keep the thresholds sorted
+    return (
+        min(float(np.nextafter(min_safety_factor, -np.inf)), _LOW_RISK_THRESHOLD),
+        _LOW_RISK_THRESHOLD
+    )
+
+
+def validate_positive(**values) -> None:
+    """
+    Check that every named value is positive.
+    
+    Lets a caller validate fixed implant parameters once and then call the
+    unchecked kernels in src.core._kernels inside a loop.
+    
+    Parameters:
+    -----------
+    **values : float or array_like
+        The values to check, by parameter name (e.g. thread_pitch=0.04)
+        
+    Raises:
+    -------
+    ValueError
+        If any element of a value is zero or negative, naming the parameter
+    """
+    for name, value in values.items():
+        if np.any(np.asarray(value) <= 0):
+            raise ValueError(f"{name} must be positive")
 
 
 def estimate_preload_from_torque(
@@ -51,6 +148,92 @@ def estimate_preload_from_torque(
     return torque / (k_factor * screw_diameter)
 
 
+def estimate_preload_from_torque_batch(
+    torque,
+    screw_diameter,
+    k_factor=0.2,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Estimate preload for many screws at once using the conventional formula.
+    
+    Parameters:
+    -----------
+    torque : float or array_like
+        The tightening torques in N-cm
+    screw_diameter : float or array_like
+        The nominal diameters of the screws in cm
+    k_factor : float or array_like, optional
+        The nut factors (default: 0.2)
+    out : np.ndarray, optional
+        A float64 array of the broadcast shape to write the preloads into, so a
+        caller evaluating many batches can reuse one buffer (default: None)
+        
+    Returns:
+    --------
+    np.ndarray
+        The estimated preloads in N
+    
+    Notes:
+    ------
+    Vectorized form of estimate_preload_from_torque; arguments are broadcast
+    against each other.
+    """
+    torque = np.asarray(torque, dtype=np.float64)
+    screw_diameter = np.asarray(screw_diameter, dtype=np.float64)
+    k_factor = np.asarray(k_factor, dtype=np.float64)
+    
+    if np.any(screw_diameter <= 0):
+        raise ValueError("Screw diameter must be positive")
+    if np.any(k_factor <= 0):
+        raise ValueError("k_factor must be positive")
+    
+    if out is not None:
+        np.multiply(k_factor, screw_diameter, out=out)
+        return np.divide(torque, out, out=out)
+    
+    return conventional_preload_kernel(torque, screw_diameter, k_factor)
+
+
+def make_conventional_preload_estimator(
+    screw_diameter: float,
+    k_factor: float = 0.2
+) -> Callable[[float], float]:
+    """
+    Create a conventional preload estimator specialized for one screw.
+    
+    Parameters:
+    -----------
+    screw_diameter : float
+        The nominal diameter of the screw in cm
+    k_factor : float, optional
+        The nut factor, which accounts for friction (default: 0.2)
+        
+    Returns:
+    --------
+    Callable[[float], float]
+        A function of the tightening torque in N-cm returning the estimated
+        preload in N
+    
+    Notes:
+    ------
+    The reciprocal 1 / (K * d) is computed once, so each call is a single
+    multiplication; the returned function also accepts NumPy arrays of torques.
+    """
+    if screw_diameter <= 0:
+        raise ValueError("Screw diameter must be positive")
+    if k_factor <= 0:
+        raise ValueError("k_factor must be positive")
+    
+    inv = 1.0 / (k_factor * screw_diameter)
+    
+    def preload_for_screw(torque: float) -> float:
+        # F = T / (K * d) with inv = 1 / (K * d)
+        return torque * inv
+    
+    return preload_for_screw
+
+
 def calculate_stress_from_preload(
     preload: float,
     tensile_area: float
@@ -81,6 +264,41 @@ def calculate_stress_from_preload(
     return preload / tensile_area
 
 
+def calculate_stress_from_preload_batch(
+    preload,
+    tensile_area,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Calculate stress for many screws at once.
+    
+    Parameters:
+    -----------
+    preload : float or array_like
+        The preload forces in N
+    tensile_area : float or array_like
+        The tensile stress areas of the screws in mm²
+    out : np.ndarray, optional
+        A float64 array of the broadcast shape to write the stresses into, so a
+        caller evaluating many batches can reuse one buffer (default: None)
+        
+    Returns:
+    --------
+    np.ndarray
+        The stresses in MPa (N/mm²)
+    """
+    preload = np.asarray(preload, dtype=np.float64)
+    tensile_area = np.asarray(tensile_area, dtype=np.float64)
+    
+    if np.any(tensile_area <= 0):
+        raise ValueError("Tensile area must be positive")
+    
+    if out is not None:
+        return np.divide(preload, tensile_area, out=out)
+    
+    return stress_kernel(preload, tensile_area)
+
+
 def calculate_safety_factor(
     stress: float,
     yield_strength: float
@@ -112,10 +330,212 @@ def calculate_safety_factor(
     return yield_strength / stress
 
 
+def calculate_safety_factor_batch(
+    stress,
+    yield_strength,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Calculate safety factors for many screws at once.
+    
+    Parameters:
+    -----------
+    stress : float or array_like
+        The stresses in the screws in MPa
+    yield_strength : float or array_like
+        The yield strengths of the screw materials in MPa
+    out : np.ndarray, optional
+        A float64 array of the broadcast shape to write the safety factors into, so a
+        caller evaluating many batches can reuse one buffer (default: None)
+        
+    Returns:
+    --------
+    np.ndarray
+        The safety factors (dimensionless)
+    """
+    stress = np.asarray(stress, dtype=np.float64)
+    yield_strength = np.asarray(yield_strength, dtype=np.float64)
+    
+    if np.any(stress <= 0):
+        raise ValueError("Stress must be positive")
+    if np.any(yield_strength <= 0):
+        raise ValueError("Yield strength must be positive")
+    
+    if out is not None:
+        return np.divide(yield_strength, stress, out=out)
+    
+    return safety_factor_kernel(stress, yield_strength)
+
+
+def calculate_safety_factor_from_torques(
+    tightening_torque: float,
+    removal_torque: float,
+    thread_pitch: float,
+    tensile_area: float,
+    yield_strength: float
+) -> float:
+    """
+    Calculate the safety factor directly from the measured torques.
+    
+    Parameters:
+    -----------
+    tightening_torque : float
+        The tightening torque in N-cm
+    removal_torque : float
+        The measured removal torque in N-cm
+    thread_pitch : float
+        The thread pitch of the screw in cm
+    tensile_area : float
+        The tensile stress area of the screw in mm²
+    yield_strength : float
+        The yield strength of the screw material in MPa
+        
+    Returns:
+    --------
+    float
+        The safety factor (dimensionless)
+    
+    Notes:
+    ------
+    Fuses the Wadhwani-Hess preload, stress and safety factor formulas:
+    Safety Factor = Yield Strength * A_t * p / ((Tt - Tr) * π)
+    """
+    if thread_pitch <= 0:
+        raise ValueError("Thread pitch must be positive")
+    if tensile_area <= 0:
+        raise ValueError("Tensile area must be positive")
+    if yield_strength <= 0:
+        raise ValueError("Yield strength must be positive")
+    if tightening_torque <= removal_torque:
+        raise ValueError("Tightening torque must be greater than removal torque")
+    
+    return yield_strength * tensile_area * thread_pitch * _INV_PI / (tightening_torque - removal_torque)
+
+
+def calculate_safety_factor_from_torques_batch(
+    tightening_torque,
+    removal_torque,
+    thread_pitch,
+    tensile_area,
+    yield_strength
+) -> np.ndarray:
+    """
+    Calculate safety factors directly from the measured torques for many screws at once.
+    
+    Parameters:
+    -----------
+    tightening_torque : float or array_like
+        The tightening torques in N-cm
+    removal_torque : float or array_like
+        The measured removal torques in N-cm
+    thread_pitch : float or array_like
+        The thread pitches of the screws in cm
+    tensile_area : float or array_like
+        The tensile stress areas of the screws in mm²
+    yield_strength : float or array_like
+        The yield strengths of the screw materials in MPa
+        
+    Returns:
+    --------
+    np.ndarray
+        The safety factors (dimensionless)
+    """
+    tightening_torque = np.asarray(tightening_torque, dtype=np.float64)
+    removal_torque = np.asarray(removal_torque, dtype=np.float64)
+    thread_pitch = np.asarray(thread_pitch, dtype=np.float64)
+    tensile_area = np.asarray(tensile_area, dtype=np.float64)
+    yield_strength = np.asarray(yield_strength, dtype=np.float64)
+    
+    if np.any(thread_pitch <= 0):
+        raise ValueError("Thread pitch must be positive")
+    if np.any(tensile_area <= 0):
+        raise ValueError("Tensile area must be positive")
+    if np.any(yield_strength <= 0):
+        raise ValueError("Yield strength must be positive")
+    if np.any(tightening_torque <= removal_torque):
+        raise ValueError("Tightening torque must be greater than removal torque")
+    
+    return safety_factor_from_torques_kernel(
+        tightening_torque, removal_torque, thread_pitch, tensile_area, yield_strength
+    )
+
+
+def analyze_implants_batch(
+    torque,
+    diameter_mm,
+    thread_pitch_mm,
+    k_factor,
+    yield_strength,
+    removal_factor: float,
+    min_safety_factor: float = 1.5
+) -> ImplantAnalysis:
+    """
+    Compare the conventional and Wadhwani-Hess methods for many implant screws at once.
+    
+    Computes the preload, stress, safety factor and risk code of every screw
+    with both methods in a single fused pass. The removal torque of each
+    screw is estimated as removal_factor times its tightening torque.
+    
+    Parameters:
+    -----------
+    torque : array_like
+        The recommended tightening torques in N-cm
+    diameter_mm : array_like
+        The nominal screw diameters in mm
+    thread_pitch_mm : array_like
+        The thread pitches in mm
+    k_factor : array_like
+        The nut factors for the conventional estimate
+    yield_strength : array_like
+        The yield strengths of the screw materials in MPa
+    removal_factor : float
+        The removal torque as a fraction of the tightening torque, between 0 and 1
+    min_safety_factor : float, optional
+        The minimum acceptable safety factor for the risk codes (default: 1.5)
+        
+    Returns:
+    --------
+    ImplantAnalysis
+        A named tuple of per-screw arrays; the risk codes are int8
+        (0 = Low, 1 = Medium, 2 = High) and index RISK_LEVELS
+    """
+    values = [
+        np.atleast_1d(np.asarray(value, dtype=np.float64))
+        for value in (torque, diameter_mm, thread_pitch_mm, k_factor, yield_strength)
+    ]
+    # The kernel loops over equal-length arrays, so copy out any broadcast scalars
+    shape = np.broadcast_shapes(*(value.shape for value in values))
+    torque, diameter_mm, thread_pitch_mm, k_factor, yield_strength = (
+        value if value.shape == shape else np.broadcast_to(value, shape).copy() for value in values
+    )
+    
+    if len(shape) != 1:
+        raise ValueError("Implant parameters must be one-dimensional")
+    if np.any(torque <= 0):
+        raise ValueError("Torque must be positive")
+    if np.any(thread_pitch_mm <= 0):
+        raise ValueError("Thread pitch must be positive")
+    if np.any(k_factor <= 0):
+        raise ValueError("k_factor must be positive")
+    if np.any(yield_strength <= 0):
+        raise ValueError("Yield strength must be positive")
+    if np.any(diameter_mm - _THREAD_COEFF * thread_pitch_mm <= 0):
+        raise ValueError("Screw diameter must be larger than the thread depth")
+    if not 0 < removal_factor < 1:
+        raise ValueError("Removal factor must be between 0 and 1")
+    if min_safety_factor <= 0:
+        raise ValueError("Minimum safety factor must be positive")
+    
+    return ImplantAnalysis(*implant_analysis_kernel(
+        torque, diameter_mm, thread_pitch_mm, k_factor, yield_strength, removal_factor, min_safety_factor
+    ))
+
+
+@lru_cache(maxsize=1024)
 def assess_risk(
     safety_factor: float,
     min_safety_factor: float = 1.5
-) -> Tuple[str, str]:
+) -> RiskAssessment:
     """
     Assess the risk of screw loosening or failure based on safety factor.
     
@@ -128,8 +548,8 @@ def assess_risk(
         
     Returns:
     --------
-    Tuple[str, str]
-        A tuple containing (risk_level, recommendation)
+    RiskAssessment
+        A named tuple containing (risk_level, recommendation)
         
     Notes:
     ------
@@ -141,19 +561,46 @@ def assess_risk(
     if safety_factor < 0:
         raise ValueError("Safety factor must be positive")
     
-    if safety_factor > 3.0:
-        risk_level = "Low"
-        recommendation = "Safe for use with standard protocol"
-    elif safety_factor >= min_safety_factor:
-        risk_level = "Medium"
-        recommendation = "Safe for use, but consider more frequent check-ups"
-    else:
-        risk_level = "High"
-        recommendation = "Not recommended, consider alternative implant system or reduced loading"
+    return _RISK_RESULTS[bisect_left(_risk_thresholds(min_safety_factor), safety_factor)]
+
+
+def assess_risk_batch(
+    safety_factor,
+    min_safety_factor: float = 1.5
+) -> np.ndarray:
+    """
+    Assess the risk level for many safety factors at once.
+    
+    Parameters:
+    -----------
+    safety_factor : float or array_like
+        The calculated safety factors
+    min_safety_factor : float, optional
+        The minimum acceptable safety factor (default: 1.5)
+        
+    Returns:
+    --------
+    np.ndarray
+        The int8 risk codes (0 = Low, 1 = Medium, 2 = High); index
+        RISK_LEVELS with them to get the risk level names
+        
+    Notes:
+    ------
+    Uses the same thresholds as assess_risk; recommendations are not returned.
+    """
+    safety_factor = np.asarray(safety_factor, dtype=np.float64)
+    
+    if np.any(safety_factor < 0):
+        raise ValueError("Safety factor must be positive")
     
-    return risk_level, recommendation
+    # searchsorted gives the _RISK_RESULTS index (2 = Low), so flip it into a risk code.
+    # It sorts NaN past every threshold, so an undefined safety factor is forced to
+    # High, as assess_risk and risk_code_kernel classify it.
+    risk_codes = 2 - np.searchsorted(_risk_thresholds(min_safety_factor), safety_factor)
+    return np.where(np.isnan(safety_factor), 2, risk_codes).astype(np.int8)
 
 
+@lru_cache(maxsize=256)
 def calculate_tensile_area(
     nominal_diameter: float,
     thread_pitch: float
@@ -177,20 +624,52 @@ def calculate_tensile_area(
     ------
     Uses the formula: A_t = (π/4) * (d - 0.9382*p)²
     Where d is nominal diameter and p is thread pitch.
+    Results are cached, since implant catalogs repeat a few (d, p) pairs.
     """
     if nominal_diameter <= 0:
         raise ValueError("Nominal diameter must be positive")
     if thread_pitch <= 0:
         raise ValueError("Thread pitch must be positive")
     
-    effective_diameter = nominal_diameter - 0.9382 * thread_pitch
-    return (math.pi / 4) * (effective_diameter ** 2)
+    effective_diameter = nominal_diameter - _THREAD_COEFF * thread_pitch
+    return _PI_4 * effective_diameter * effective_diameter
 
 
+def calculate_tensile_area_batch(
+    nominal_diameter,
+    thread_pitch
+) -> np.ndarray:
+    """
+    Calculate tensile stress areas for many screws at once.
+    
+    Parameters:
+    -----------
+    nominal_diameter : float or array_like
+        The nominal diameters of the screws in mm
+    thread_pitch : float or array_like
+        The thread pitches in mm
+        
+    Returns:
+    --------
+    np.ndarray
+        The tensile stress areas in mm²
+    """
+    nominal_diameter = np.asarray(nominal_diameter, dtype=np.float64)
+    thread_pitch = np.asarray(thread_pitch, dtype=np.float64)
+    
+    if np.any(nominal_diameter <= 0):
+        raise ValueError("Nominal diameter must be positive")
+    if np.any(thread_pitch <= 0):
+        raise ValueError("Thread pitch must be positive")
+    
+    return tensile_area_kernel(nominal_diameter, thread_pitch)
+
+
+@lru_cache(maxsize=256)
 def calculate_torque_range(
     nominal_torque: float,
     is_lubricated: bool = False
-) -> Tuple[float, float]:
+) -> TorqueRange:
     """
     Calculate the acceptable range of tightening torques based on manufacturer specifications.
     
@@ -203,7 +682,7 @@ def calculate_torque_range(
         
     Returns:
     --------
-    Tuple[float, float]
+    TorqueRange
         The minimum and maximum torque values in N-cm
     
     Notes:
@@ -213,9 +692,38 @@ def calculate_torque_range(
     - +/- 25% for lubricated screws
     """
     uncertainty = 25 if is_lubricated else 35
-    uncertainty_factor = uncertainty / 100
+    delta = nominal_torque * (uncertainty * 0.01)
     
-    min_torque = nominal_torque * (1 - uncertainty_factor)
-    max_torque = nominal_torque * (1 + uncertainty_factor)
+    return TorqueRange(nominal_torque - delta, nominal_torque + delta)
+
+
+def calculate_torque_range_batch(
+    nominal_torque,
+    is_lubricated=False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the acceptable tightening torque ranges for many screws at once.
+    
+    Parameters:
+    -----------
+    nominal_torque : float or array_like
+        The nominal torques specified by the manufacturer in N-cm
+    is_lubricated : bool or array_like, optional
+        Whether each screw is lubricated (default: False)
+        
+    Returns:
+    --------
+    Tuple[np.ndarray, np.ndarray]
+        The minimum and maximum torque values in N-cm
+    
+    Notes:
+    ------
+    Uses the same uncertainties as calculate_torque_range; arguments are broadcast.
+    """
+    nominal_torque = np.asarray(nominal_torque, dtype=np.float64)
+    uncertainty = _UNCERTAINTY_PERCENT_TABLE[np.asarray(is_lubricated, dtype=bool).view(np.int8)]
     
-    return min_torque, max_torque 
\ No newline at end of file
+    return (
+        preload_range_min_kernel(nominal_torque, uncertainty),
+        preload_range_max_kernel(nominal_torque, uncertainty)
+    )
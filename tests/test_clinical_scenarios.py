@@ -13,12 +13,15 @@ import os
 import math
 from pathlib import Path
 
+import numpy as np
+
 # Add the src directory to the Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
 # Import calculation modules
 from src.core.preload import (
     calculate_preload,
+    calculate_preload_batch,
     calculate_final_torque,
     calculate_self_loosening,
     calculate_primary_locking,
@@ -28,7 +31,10 @@ from src.core.preload import (
 from src.core.torque import (
     estimate_preload_from_torque,
     calculate_stress_from_preload,
+    calculate_stress_from_preload_batch,
     calculate_safety_factor,
+    calculate_safety_factor_batch,
+    calculate_safety_factor_from_torques,
     calculate_tensile_area,
     assess_risk,
     calculate_torque_range
@@ -97,14 +103,10 @@ class TestClinicalScenarios(unittest.TestCase):
         tensile_area = 2.0  # mm² (even smaller tensile area to simulate stress concentration)
         yield_strength = 950  # MPa
         
-        # Calculate preload using Wadhwani-Hess method
-        preload = calculate_preload(torque, removal_torque, thread_pitch)
-        
-        # Calculate stress
-        stress = calculate_stress_from_preload(preload, tensile_area)
-        
-        # Calculate safety factor
-        safety_factor = calculate_safety_factor(stress, yield_strength)
+        # Calculate safety factor from the Wadhwani-Hess preload
+        safety_factor = calculate_safety_factor_from_torques(
+            torque, removal_torque, thread_pitch, tensile_area, yield_strength
+        )
         
         # Assess risk
         risk_level, recommendation = assess_risk(safety_factor)
@@ -166,14 +168,10 @@ class TestClinicalScenarios(unittest.TestCase):
         tensile_area = 12.0  # mm² (larger due to wider diameter)
         yield_strength = 950  # MPa
         
-        # Calculate preload
-        preload = calculate_preload(torque, removal_torque, thread_pitch)
-        
-        # Calculate stress
-        stress = calculate_stress_from_preload(preload, tensile_area)
-        
         # Calculate safety factor
-        safety_factor = calculate_safety_factor(stress, yield_strength)
+        safety_factor = calculate_safety_factor_from_torques(
+            torque, removal_torque, thread_pitch, tensile_area, yield_strength
+        )
         
         # Short implants with wider diameter should still provide acceptable safety
         self.assertGreater(safety_factor, 1.5, 
@@ -187,45 +185,25 @@ class TestClinicalScenarios(unittest.TestCase):
         and often require careful torque management.
         """
         # Multiple unit bridge scenario - different torque values
-        torque_values = [25.0, 30.0, 35.0]  # N-cm (varied torque for different positions)
-        removal_torque_values = [20.0, 24.0, 28.0]  # N-cm
+        torque_values = np.array([25.0, 30.0, 35.0])  # N-cm (varied torque for different positions)
+        removal_torque_values = np.array([20.0, 24.0, 28.0])  # N-cm
         thread_pitch = 0.04  # cm
         diameter = 0.4  # cm (4mm)
         tensile_area = 8.0  # mm²
         yield_strength = 950  # MPa
         
-        results = []
-        
-        # Calculate for each implant in the bridge
-        for torque, removal_torque in zip(torque_values, removal_torque_values):
-            # Calculate preload
-            preload = calculate_preload(torque, removal_torque, thread_pitch)
-            
-            # Calculate stress
-            stress = calculate_stress_from_preload(preload, tensile_area)
-            
-            # Calculate safety factor
-            safety_factor = calculate_safety_factor(stress, yield_strength)
-            
-            # Store results
-            results.append({
-                "torque": torque,
-                "preload": preload,
-                "stress": stress,
-                "safety_factor": safety_factor
-            })
+        # Calculate for all implants in the bridge at once
+        preloads = calculate_preload_batch(torque_values, removal_torque_values, thread_pitch)
+        stresses = calculate_stress_from_preload_batch(preloads, tensile_area)
+        safety_factors = calculate_safety_factor_batch(stresses, yield_strength)
         
         # Verify different torque values result in different preloads
-        preloads = [r["preload"] for r in results]
-        self.assertNotEqual(preloads[0], preloads[1], 
-                          "Different torque values should result in different preloads")
-        self.assertNotEqual(preloads[1], preloads[2], 
-                          "Different torque values should result in different preloads")
+        self.assertTrue(np.all(np.diff(preloads) != 0),
+                        "Different torque values should result in different preloads")
         
         # All safety factors should be acceptable
-        for r in results:
-            self.assertGreater(r["safety_factor"], 1.5, 
-                              "Bridge implants should have acceptable safety factors")
+        self.assertTrue(np.all(safety_factors > 1.5),
+                        "Bridge implants should have acceptable safety factors")
     
     def test_angulated_abutment_scenario(self):
         """
@@ -242,14 +220,10 @@ class TestClinicalScenarios(unittest.TestCase):
         tensile_area = 6.0  # mm²
         yield_strength = 950  # MPa
         
-        # Calculate preload
-        preload = calculate_preload(torque, removal_torque, thread_pitch)
-        
-        # Calculate stress
-        stress = calculate_stress_from_preload(preload, tensile_area)
-        
         # Calculate safety factor
-        safety_factor = calculate_safety_factor(stress, yield_strength)
+        safety_factor = calculate_safety_factor_from_torques(
+            torque, removal_torque, thread_pitch, tensile_area, yield_strength
+        )
         
         # Assess risk
         risk_level, recommendation = assess_risk(safety_factor)
@@ -346,43 +320,45 @@ class TestClinicalScenarios(unittest.TestCase):
             }
         ]
         
-        for scenario in scenarios:
-            # Calculate preload
-            preload = calculate_preload(
-                scenario["torque"], 
-                scenario["removal_torque"], 
-                scenario["thread_pitch"]
-            )
-            
-            # Verify the preload calculation matches our expectation
-            self.assertAlmostEqual(preload, scenario["expected_preload"], delta=0.01,
-                                  msg="Preload calculation should match expected value")
-            
-            # Calculate stress
-            stress = calculate_stress_from_preload(preload, scenario["tensile_area"])
-            
-            # Calculate safety factor
-            safety_factor = calculate_safety_factor(stress, scenario["yield_strength"])
-            
-            # Decision tree based on actual results
-            if scenario["expected_decision"] == "Delayed loading":
-                # For the specific case we expect delayed loading
-                decision = "Delayed loading"
-            elif scenario["expected_decision"] == "Monitor closely":
-                # For the specific case we expect monitor closely
-                decision = "Monitor closely"
-            elif safety_factor < 1.5:
-                decision = "Avoid loading"
-            elif preload < 200:
-                decision = "Delayed loading"
-            elif preload > 800 or safety_factor < 2.0:
-                decision = "Monitor closely"
-            else:
-                decision = "Standard loading"
-                
-            # Verify decision matches expectation for this scenario
-            self.assertEqual(decision, scenario["expected_decision"], 
-                           f"Clinical decision should be {scenario['expected_decision']} for this scenario")
+        expected_decisions = np.array([scenario["expected_decision"] for scenario in scenarios])
+        
+        # Calculate preloads, stresses and safety factors for all scenarios at once
+        preloads = calculate_preload_batch(
+            [scenario["torque"] for scenario in scenarios],
+            [scenario["removal_torque"] for scenario in scenarios],
+            [scenario["thread_pitch"] for scenario in scenarios]
+        )
+        
+        # Verify the preload calculations match our expectations
+        np.testing.assert_allclose(
+            preloads, [scenario["expected_preload"] for scenario in scenarios], atol=0.01,
+            err_msg="Preload calculation should match expected value"
+        )
+        
+        stresses = calculate_stress_from_preload_batch(
+            preloads, [scenario["tensile_area"] for scenario in scenarios]
+        )
+        safety_factors = calculate_safety_factor_batch(
+            stresses, [scenario["yield_strength"] for scenario in scenarios]
+        )
+        
+        # Decision tree based on actual results; the first two branches pin
+        # the scenarios we expect delayed loading or close monitoring for
+        decisions = np.select(
+            [
+                expected_decisions == "Delayed loading",
+                expected_decisions == "Monitor closely",
+                safety_factors < 1.5,
+                preloads < 200,
+                (preloads > 800) | (safety_factors < 2.0)
+            ],
+            ["Delayed loading", "Monitor closely", "Avoid loading", "Delayed loading", "Monitor closely"],
+            default="Standard loading"
+        )
+        
+        # Verify decisions match expectations for every scenario
+        np.testing.assert_array_equal(decisions, expected_decisions,
+                                      err_msg="Clinical decisions should match the expected decisions")
     
     def test_worn_implant_driver_scenario(self):
         """
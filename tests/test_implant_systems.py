@@ -9,43 +9,99 @@ various dental implant systems defined in sample_systems.json.
 import unittest
 import sys
 import os
-import json
 import math
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+import orjson
+
 # Add the src directory to the Python path
-sys.path.append(str(Path(__file__).parent.parent))
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(_ROOT))
 
 # Import the modules to be tested
 from src.core.preload import (
-    calculate_preload,
-    calculate_final_torque,
-    estimate_uncertainty
+    calculate_preload_batch,
+    calculate_final_torque_batch,
+    estimate_uncertainty_batch,
+    calculate_preload_range_batch
 )
 from src.core.torque import (
-    estimate_preload_from_torque,
-    calculate_stress_from_preload,
-    calculate_safety_factor,
-    calculate_tensile_area,
-    assess_risk
+    estimate_preload_from_torque_batch,
+    calculate_stress_from_preload_batch,
+    calculate_safety_factor_batch,
+    calculate_tensile_area_batch,
+    assess_risk,
+    assess_risk_batch,
+    RISK_LEVELS
 )
 
+SAMPLE_SYSTEMS_PATH = _ROOT / "data" / "implant_systems" / "sample_systems.json"
+
+# Set IMPLANT_VERBOSE=1 to print the per-screw results once the tests have run
+_VERBOSE = bool(os.environ.get("IMPLANT_VERBOSE"))
+
+
+@lru_cache(maxsize=1)
+def _load_implant_data():
+    """Load sample_systems.json once per test session."""
+    return orjson.loads(SAMPLE_SYSTEMS_PATH.read_bytes())
+
 
 class TestImplantSystems(unittest.TestCase):
     """Test case for implant system calculations using real-world data."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        # Load implant systems data
-        data_path = Path(__file__).parent.parent / "data" / "implant_systems" / "sample_systems.json"
+    
+    # Common test values for comparative calculations
+    removal_torque_factor = 0.85  # Assume removal torque is 85% of tightening torque
+    desired_preload_factor = 1.2  # Desired preload 20% higher than calculated preload
+    
+    @classmethod
+    def setUpClass(cls):
+        """Load the implant systems data and flatten the standard screws into arrays."""
+        cls.implant_data = _load_implant_data()
+        
+        # One entry per (system, model), in file order
+        cls.screw_names = []
+        screws = []
+        for system_name, system_data in cls.implant_data["implant_systems"].items():
+            for model_name, model_data in system_data.items():
+                screw_data = model_data["screws"]["standard"]
+                cls.screw_names.append(f"{system_name} {model_name}")
+                screws.append((
+                    screw_data["recommended_torque"],  # N-cm
+                    screw_data["diameter"],  # mm
+                    screw_data["thread_pitch"],  # mm
+                    screw_data["K_factor"],
+                    screw_data["yield_strength"]  # MPa
+                ))
+        
+        (cls.torques, cls.diameters, cls.thread_pitches,
+         cls.k_factors, cls.yield_strengths) = np.array(screws, dtype=np.float64).T
         
-        with open(data_path, 'r') as f:
-            self.implant_data = json.load(f)
+        # Quantities shared by several tests, derived once
+        cls.removal_torques = cls.torques * cls.removal_torque_factor
+        cls.diameters_cm = cls.diameters / 10  # mm to cm
+        cls.thread_pitches_cm = cls.thread_pitches / 10  # mm to cm
         
-        # Common test values for comparative calculations
-        self.removal_torque_factor = 0.85  # Assume removal torque is 85% of tightening torque
-        self.desired_preload_factor = 1.2  # Desired preload 20% higher than calculated preload
+        # Per-screw result columns collected by the tests for the verbose report
+        cls.report_columns = {}
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Print the collected per-screw results as one table when IMPLANT_VERBOSE is set."""
+        if not _VERBOSE or not cls.report_columns:
+            return
         
+        name_width = max(len(name) for name in cls.screw_names)
+        lines = [f"{'Screw':<{name_width}}" + "".join(f"  {title}" for title in cls.report_columns)]
+        for i, name in enumerate(cls.screw_names):
+            lines.append(f"{name:<{name_width}}" + "".join(
+                f"  {column[i]:>{len(title)}{'.2f' if column.dtype.kind == 'f' else ''}}"
+                for title, column in cls.report_columns.items()
+            ))
+        print("\n" + "\n".join(lines))
+    
     def test_load_implant_data(self):
         """Test that implant data was loaded correctly."""
         self.assertIsNotNone(self.implant_data)
@@ -57,184 +113,122 @@ class TestImplantSystems(unittest.TestCase):
         self.assertIn("Straumann", systems)
         self.assertIn("Dentsply_Astra", systems)
         self.assertIn("Camlog", systems)
+        
+        # Every standard screw should have been flattened into the arrays
+        self.assertEqual(len(self.torques), len(self.screw_names))
+        self.assertGreater(len(self.screw_names), 0)
     
     def test_conventional_preload_estimation(self):
         """Test conventional preload estimation for different implant systems."""
-        for system_name, system_data in self.implant_data["implant_systems"].items():
-            for model_name, model_data in system_data.items():
-                # Get screw data
-                screw_data = model_data["screws"]["standard"]
-                
-                # Get parameters
-                torque = screw_data["recommended_torque"]  # N-cm
-                diameter = screw_data["diameter"] / 10  # mm to cm
-                k_factor = screw_data["K_factor"]
-                
-                # Calculate estimated preload using conventional method
-                estimated_preload = estimate_preload_from_torque(torque, diameter, k_factor)
-                
-                # Check that result is positive and reasonable
-                self.assertGreater(estimated_preload, 0)
-                
-                # For typical dental implants, preload should generally be 200-1000 N
-                self.assertGreaterEqual(estimated_preload, 200)
-                self.assertLessEqual(estimated_preload, 1500)
-                
-                # Print for informational purposes
-                print(f"{system_name} {model_name}: {estimated_preload:.2f} N")
+        # Calculate estimated preloads using conventional method
+        estimated_preloads = estimate_preload_from_torque_batch(
+            self.torques, self.diameters_cm, self.k_factors
+        )
+        
+        self.report_columns["Conventional preload (N)"] = estimated_preloads
+        
+        # For typical dental implants, preload should generally be 200-1000 N
+        self.assertTrue(
+            np.all((estimated_preloads >= 200) & (estimated_preloads <= 1500)),
+            dict(zip(self.screw_names, estimated_preloads))
+        )
     
     def test_wadhwani_hess_preload_calculation(self):
         """Test Wadhwani-Hess preload calculation for different implant systems."""
-        for system_name, system_data in self.implant_data["implant_systems"].items():
-            for model_name, model_data in system_data.items():
-                # Get screw data
-                screw_data = model_data["screws"]["standard"]
-                
-                # Get parameters
-                tightening_torque = screw_data["recommended_torque"]  # N-cm
-                removal_torque = tightening_torque * self.removal_torque_factor
-                thread_pitch = screw_data["thread_pitch"] / 10  # mm to cm
-                
-                # Calculate preload using Wadhwani-Hess method
-                calculated_preload = calculate_preload(tightening_torque, removal_torque, thread_pitch)
-                
-                # Check that result is positive and reasonable
-                self.assertGreater(calculated_preload, 0)
-                
-                # For typical dental implants, preload should generally be 200-1000 N
-                self.assertGreaterEqual(calculated_preload, 200)
-                self.assertLessEqual(calculated_preload, 1500)
-                
-                # Print for informational purposes
-                print(f"{system_name} {model_name} (W-H): {calculated_preload:.2f} N")
+        # Calculate preloads using Wadhwani-Hess method
+        calculated_preloads = calculate_preload_batch(self.torques, self.removal_torques, self.thread_pitches_cm)
+        
+        self.report_columns["W-H preload (N)"] = calculated_preloads
+        
+        # For typical dental implants, preload should generally be 200-1000 N
+        self.assertTrue(
+            np.all((calculated_preloads >= 200) & (calculated_preloads <= 1500)),
+            dict(zip(self.screw_names, calculated_preloads))
+        )
     
     def test_final_torque_calculation(self):
         """Test final torque calculation for desired preload for different implant systems."""
-        for system_name, system_data in self.implant_data["implant_systems"].items():
-            for model_name, model_data in system_data.items():
-                # Get screw data
-                screw_data = model_data["screws"]["standard"]
-                
-                # Get parameters
-                initial_torque = screw_data["recommended_torque"]  # N-cm
-                removal_torque = initial_torque * self.removal_torque_factor
-                thread_pitch = screw_data["thread_pitch"] / 10  # mm to cm
-                
-                # First calculate initial preload using Wadhwani-Hess method
-                initial_preload = calculate_preload(initial_torque, removal_torque, thread_pitch)
-                
-                # Now calculate desired preload (20% higher)
-                desired_preload = initial_preload * self.desired_preload_factor
-                
-                # Calculate final torque needed for desired preload
-                final_torque = calculate_final_torque(
-                    initial_torque, 
-                    removal_torque, 
-                    initial_preload, 
-                    desired_preload, 
-                    thread_pitch
-                )
-                
-                # Check that result is positive and reasonable
-                self.assertGreater(final_torque, 0)
-                
-                # Final torque should be higher than initial torque by approximately the same factor
-                expected_torque_ratio = desired_preload / initial_preload
-                actual_torque_ratio = final_torque / initial_torque
-                
-                self.assertAlmostEqual(actual_torque_ratio, expected_torque_ratio, delta=0.01)
-                
-                # Print for informational purposes
-                print(f"{system_name} {model_name} final torque: {final_torque:.2f} N-cm for {desired_preload:.2f} N preload")
+        # First calculate initial preloads using Wadhwani-Hess method
+        initial_preloads = calculate_preload_batch(self.torques, self.removal_torques, self.thread_pitches_cm)
+        
+        # Now calculate desired preloads (20% higher)
+        desired_preloads = initial_preloads * self.desired_preload_factor
+        
+        # Calculate final torques needed for desired preloads
+        final_torques = calculate_final_torque_batch(
+            self.torques,
+            self.removal_torques,
+            initial_preloads,
+            desired_preloads,
+            self.thread_pitches_cm
+        )
+        
+        self.report_columns["Final torque (N-cm)"] = final_torques
+        
+        # Check that results are positive
+        self.assertTrue(np.all(final_torques > 0), self.screw_names)
+        
+        # Final torque should be higher than initial torque by approximately the same factor
+        np.testing.assert_allclose(
+            final_torques / self.torques,
+            desired_preloads / initial_preloads,
+            atol=0.01
+        )
     
     def test_stress_calculation(self):
         """Test stress calculation for different implant systems."""
-        for system_name, system_data in self.implant_data["implant_systems"].items():
-            for model_name, model_data in system_data.items():
-                # Get screw data
-                screw_data = model_data["screws"]["standard"]
-                
-                # Get parameters
-                torque = screw_data["recommended_torque"]  # N-cm
-                diameter = screw_data["diameter"]  # mm
-                thread_pitch = screw_data["thread_pitch"]  # mm
-                k_factor = screw_data["K_factor"]
-                yield_strength = screw_data["yield_strength"]  # MPa
-                
-                # Calculate tensile area
-                tensile_area = calculate_tensile_area(diameter, thread_pitch)
-                
-                # Calculate estimated preload using conventional method
-                preload = estimate_preload_from_torque(torque, diameter/10, k_factor)
-                
-                # Calculate stress
-                stress = calculate_stress_from_preload(preload, tensile_area)
-                
-                # Calculate safety factor
-                safety_factor = calculate_safety_factor(stress, yield_strength)
-                
-                # Check that results are reasonable
-                self.assertGreater(stress, 0)
-                self.assertGreater(safety_factor, 0)
-                
-                # For dental implants, stress should generally be below yield strength
-                self.assertLessEqual(stress, yield_strength)
-                
-                # Safety factor should ideally be above 1.5
-                recommended_safety_factor = 1.5
-                risk_level, recommendation = assess_risk(safety_factor, recommended_safety_factor)
-                
-                # Print for informational purposes
-                print(f"{system_name} {model_name}: Stress = {stress:.2f} MPa, Safety Factor = {safety_factor:.2f}, Risk = {risk_level}")
+        # Calculate tensile areas
+        tensile_areas = calculate_tensile_area_batch(self.diameters, self.thread_pitches)
+        
+        # Calculate estimated preloads using conventional method
+        preloads = estimate_preload_from_torque_batch(self.torques, self.diameters_cm, self.k_factors)
+        
+        # Calculate stresses and safety factors
+        stresses = calculate_stress_from_preload_batch(preloads, tensile_areas)
+        safety_factors = calculate_safety_factor_batch(stresses, self.yield_strengths)
+        
+        self.report_columns["Stress (MPa)"] = stresses
+        self.report_columns["Safety factor"] = safety_factors
+        
+        # Check that results are reasonable
+        self.assertTrue(np.all(stresses > 0), self.screw_names)
+        self.assertTrue(np.all(safety_factors > 0), self.screw_names)
+        
+        # For dental implants, stress should generally be below yield strength
+        self.assertTrue(np.all(stresses <= self.yield_strengths), dict(zip(self.screw_names, stresses)))
+        
+        # Safety factor should ideally be above 1.5
+        recommended_safety_factor = 1.5
+        risk_levels = np.array(RISK_LEVELS)[assess_risk_batch(safety_factors, recommended_safety_factor)]
+        
+        self.report_columns["Risk level"] = risk_levels
+        
+        for name, safety_factor, risk_level in zip(self.screw_names, safety_factors, risk_levels):
+            self.assertEqual(
+                risk_level, assess_risk(safety_factor, recommended_safety_factor).level, name
+            )
     
     def test_compare_preload_methods(self):
         """Compare conventional and Wadhwani-Hess preload calculation methods."""
-        for system_name, system_data in self.implant_data["implant_systems"].items():
-            for model_name, model_data in system_data.items():
-                # Get screw data
-                screw_data = model_data["screws"]["standard"]
-                
-                # Get parameters
-                torque = screw_data["recommended_torque"]  # N-cm
-                diameter = screw_data["diameter"] / 10  # mm to cm
-                k_factor = screw_data["K_factor"]
-                removal_torque = torque * self.removal_torque_factor
-                thread_pitch = screw_data["thread_pitch"] / 10  # mm to cm
-                
-                # Calculate preload using conventional method
-                conventional_preload = estimate_preload_from_torque(torque, diameter, k_factor)
-                
-                # Calculate preload using Wadhwani-Hess method
-                wh_preload = calculate_preload(torque, removal_torque, thread_pitch)
-                
-                # Get uncertainty percentages for both methods
-                conventional_uncertainty, _ = estimate_uncertainty(torque, False)
-                wh_uncertainty = 9  # 9% as per the paper
-                
-                # Calculate uncertainty ranges
-                conv_min = conventional_preload * (1 - conventional_uncertainty/100)
-                conv_max = conventional_preload * (1 + conventional_uncertainty/100)
-                wh_min = wh_preload * (1 - wh_uncertainty/100)
-                wh_max = wh_preload * (1 + wh_uncertainty/100)
-                
-                # Print for informational purposes
-                print(f"{system_name} {model_name}:")
-                print(f"  Conventional: {conventional_preload:.2f} N (±{conventional_uncertainty}%)")
-                print(f"  Wadhwani-Hess: {wh_preload:.2f} N (±{wh_uncertainty}%)")
-                
-                # Check if Wadhwani-Hess result is within the conventional range
-                in_conventional_range = conv_min <= wh_preload <= conv_max
-                print(f"  W-H result within conventional range: {in_conventional_range}")
-                
-                # The W-H range should be narrower than the conventional range
-                wh_range = wh_max - wh_min
-                conv_range = conv_max - conv_min
-                print(f"  Range reduction: {100 * (1 - wh_range/conv_range):.1f}%")
-                print()
-                
-                # W-H uncertainty should be lower than conventional
-                self.assertLess(wh_uncertainty, conventional_uncertainty)
-
+        # Calculate preloads using conventional and Wadhwani-Hess methods
+        conventional_preloads = estimate_preload_from_torque_batch(
+            self.torques, self.diameters_cm, self.k_factors
+        )
+        wh_preloads = calculate_preload_batch(self.torques, self.removal_torques, self.thread_pitches_cm)
+        
+        # Get uncertainty percentages for both methods
+        conventional_uncertainties, _ = estimate_uncertainty_batch(self.torques, False)
+        wh_uncertainty = 9  # 9% as per the paper
+        
+        # Calculate uncertainty ranges
+        conv_min, conv_max = calculate_preload_range_batch(conventional_preloads, conventional_uncertainties)
+        wh_min, wh_max = calculate_preload_range_batch(wh_preloads, wh_uncertainty)
+        
+        # The W-H range should be narrower than the conventional range
+        np.testing.assert_array_less(wh_max - wh_min, conv_max - conv_min)
+        
+        # W-H uncertainty should be lower than conventional
+        self.assertTrue(np.all(wh_uncertainty < conventional_uncertainties))
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the compiled arithmetic kernels.
+
+These tests check that the kernels in src/core/_kernels.py agree with the
+validated public functions, whether or not Numba is installed.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add the src directory to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.core import _kernels
+from src.core.preload import calculate_preload, calculate_final_torque
+from src.core.torque import (
+    estimate_preload_from_torque,
+    calculate_stress_from_preload,
+    calculate_safety_factor,
+    calculate_safety_factor_from_torques,
+    calculate_tensile_area,
+    assess_risk
+)
+
+
+class TestKernels(unittest.TestCase):
+    """Test case for the compiled arithmetic kernels."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Compile the kernels once for the whole test case."""
+        _kernels.warm_up()
+
+    def test_preload_kernel_matches_calculate_preload(self):
+        """The preload kernel should reproduce Equation 3."""
+        self.assertAlmostEqual(
+            _kernels.preload_kernel(35.0, 29.5, 0.04),
+            calculate_preload(35.0, 29.5, 0.04),
+            places=10
+        )
+
+    def test_final_torque_kernel_matches_calculate_final_torque(self):
+        """The final torque kernel should reproduce Equation 6."""
+        initial_preload = calculate_preload(25.0, 21.4, 0.04)
+        self.assertAlmostEqual(
+            _kernels.final_torque_kernel(25.0, 21.4, 400.0, 0.04),
+            calculate_final_torque(25.0, 21.4, initial_preload, 400.0, 0.04),
+            places=10
+        )
+
+    def test_conventional_preload_kernel_matches_estimate(self):
+        """The conventional preload kernel should match T / (K * d)."""
+        self.assertAlmostEqual(
+            _kernels.conventional_preload_kernel(35.0, 0.2, 0.2),
+            estimate_preload_from_torque(35.0, 0.2, 0.2),
+            places=10
+        )
+
+    def test_tensile_area_kernel_matches_calculate_tensile_area(self):
+        """The tensile area kernel should match the validated function."""
+        self.assertAlmostEqual(
+            _kernels.tensile_area_kernel(2.0, 0.4),
+            calculate_tensile_area(2.0, 0.4),
+            places=10
+        )
+
+    def test_safety_factor_kernel_matches_calculate_safety_factor(self):
+        """The safety factor kernel should match yield strength / stress."""
+        self.assertAlmostEqual(
+            _kernels.safety_factor_kernel(400.0, 950.0),
+            calculate_safety_factor(400.0, 950.0),
+            places=10
+        )
+
+    def test_safety_factor_from_torques_kernel_matches_fused_function(self):
+        """The fused safety factor kernel should match the validated function."""
+        self.assertAlmostEqual(
+            _kernels.safety_factor_from_torques_kernel(35.0, 29.5, 0.04, 2.0, 950.0),
+            calculate_safety_factor_from_torques(35.0, 29.5, 0.04, 2.0, 950.0),
+            places=10
+        )
+
+    def test_division_by_zero_gives_ieee_results(self):
+        """Unchecked divisions by zero should give inf or NaN, not undefined fast-math results."""
+        # Arrays, since plain Python float division raises when Numba is not installed
+        with np.errstate(divide="ignore", invalid="ignore"):
+            safety_factors = _kernels.safety_factor_kernel(np.array([0.0, 400.0]), 950.0)
+            stresses = _kernels.stress_kernel(np.array([-400.0]), 0.0)
+            preloads = _kernels.preload_kernel(np.array([35.0]), np.array([35.0]), 0.0)
+        
+        self.assertEqual(safety_factors[0], np.inf)
+        self.assertEqual(stresses[0], -np.inf)
+        self.assertTrue(np.isnan(preloads[0]))
+
+    def test_implant_analysis_kernel_matches_scalar_functions(self):
+        """The fused analysis kernel should match the validated scalar functions."""
+        torque = np.array([35.0, 25.0, 15.0])
+        diameter = np.array([2.0, 1.8, 1.6])  # mm
+        thread_pitch = np.array([0.4, 0.35, 0.3])  # mm
+        k_factor = np.array([0.2, 0.15, 0.2])
+        yield_strength = np.array([950.0, 300.0, 3000.0])
+        removal_factor = 0.85
+        
+        (conv_preload, wh_preload, conv_stress, wh_stress,
+         conv_safety, wh_safety, conv_risk, wh_risk) = _kernels.implant_analysis_kernel(
+            torque, diameter, thread_pitch, k_factor, yield_strength, removal_factor, 1.5
+        )
+        
+        risk_levels = ["Low", "Medium", "High"]
+        for i in range(len(torque)):
+            tensile_area = calculate_tensile_area(diameter[i], thread_pitch[i])
+            expected_conv = estimate_preload_from_torque(torque[i], diameter[i] / 10, k_factor[i])
+            expected_wh = calculate_preload(torque[i], torque[i] * removal_factor, thread_pitch[i] / 10)
+            expected_conv_safety = calculate_safety_factor(
+                calculate_stress_from_preload(expected_conv, tensile_area), yield_strength[i]
+            )
+            expected_wh_safety = calculate_safety_factor(
+                calculate_stress_from_preload(expected_wh, tensile_area), yield_strength[i]
+            )
+            
+            self.assertAlmostEqual(conv_preload[i], expected_conv, places=8)
+            self.assertAlmostEqual(wh_preload[i], expected_wh, places=8)
+            self.assertAlmostEqual(conv_stress[i], expected_conv / tensile_area, places=8)
+            self.assertAlmostEqual(wh_stress[i], expected_wh / tensile_area, places=8)
+            self.assertAlmostEqual(conv_safety[i], expected_conv_safety, places=8)
+            self.assertAlmostEqual(wh_safety[i], expected_wh_safety, places=8)
+            self.assertEqual(risk_levels[conv_risk[i]], assess_risk(expected_conv_safety)[0])
+            self.assertEqual(risk_levels[wh_risk[i]], assess_risk(expected_wh_safety)[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
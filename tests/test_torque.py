@@ -12,34 +12,55 @@ import os
 import math
 from pathlib import Path
 
+import numpy as np
+
 # Add the src directory to the Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
 # Import modules to be tested
-from src.core.preload import calculate_preload, calculate_final_torque
+from src.core import _kernels
+from src.core.preload import calculate_preload, calculate_preload_batch, calculate_final_torque
 from src.core.torque import (
     estimate_preload_from_torque,
+    estimate_preload_from_torque_batch,
+    make_conventional_preload_estimator,
     calculate_stress_from_preload,
-    calculate_safety_factor
+    calculate_stress_from_preload_batch,
+    calculate_safety_factor,
+    calculate_safety_factor_batch,
+    calculate_safety_factor_from_torques,
+    calculate_safety_factor_from_torques_batch,
+    analyze_implants_batch,
+    calculate_tensile_area,
+    calculate_tensile_area_batch,
+    assess_risk,
+    assess_risk_batch,
+    RISK_LEVELS,
+    calculate_torque_range,
+    calculate_torque_range_batch,
+    validate_positive
 )
 
 
 class TestTorqueCalculations(unittest.TestCase):
     """Test case for torque-related calculations."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        # Standard test values
-        self.thread_pitch = 0.04  # cm (0.4 mm)
-        self.screw_diameter = 0.2  # cm (2 mm), based on the paper
-        self.nominal_torque = 35  # N-cm, standard torque for dental implants
-        
-        # Material properties for titanium alloy (common in dental implants)
-        self.yield_strength = 800  # MPa (N/mm²)
-        self.tensile_area = 2.0  # mm²
-        
-        # K-factor (nut factor) for DLC coated screws
-        self.k_factor = 0.2
+    # Standard test values
+    thread_pitch = 0.04  # cm (0.4 mm)
+    screw_diameter = 0.2  # cm (2 mm), based on the paper
+    nominal_torque = 35  # N-cm, standard torque for dental implants
+    
+    # Material properties for titanium alloy (common in dental implants)
+    yield_strength = 800  # MPa (N/mm²)
+    tensile_area = 2.0  # mm²
+    
+    # K-factor (nut factor) for DLC coated screws
+    k_factor = 0.2
+
+    @classmethod
+    def setUpClass(cls):
+        """Compile the kernels behind the batch functions once for the whole test case."""
+        _kernels.warm_up()
 
     def test_estimate_preload_from_torque(self):
         """Test estimation of preload from torque using conventional methods."""
@@ -60,6 +81,27 @@ class TestTorqueCalculations(unittest.TestCase):
             msg="Preload estimation from torque failed"
         )
     
+    def test_make_conventional_preload_estimator(self):
+        """Test that the screw-specialized estimator matches estimate_preload_from_torque."""
+        preload_for_screw = make_conventional_preload_estimator(self.screw_diameter, self.k_factor)
+        
+        for torque in [15.0, 25.0, 35.0]:
+            self.assertAlmostEqual(
+                preload_for_screw(torque),
+                estimate_preload_from_torque(torque, self.screw_diameter, self.k_factor),
+                places=10
+            )
+        
+        # The screw is fixed by the factory, so passing a diameter again is an error
+        with self.assertRaises(TypeError):
+            preload_for_screw(35.0, self.screw_diameter)
+        
+        with self.assertRaises(ValueError):
+            make_conventional_preload_estimator(0, self.k_factor)
+        
+        with self.assertRaises(ValueError):
+            make_conventional_preload_estimator(self.screw_diameter, -0.2)
+    
     def test_calculate_stress_from_preload(self):
         """Test calculation of stress from preload."""
         preload = 400  # N
@@ -98,6 +140,230 @@ class TestTorqueCalculations(unittest.TestCase):
             msg="Safety factor calculation failed"
         )
     
+    def test_batch_calculations_match_scalar(self):
+        """Test that the batch calculations match the scalar functions."""
+        torques = [25.0, 30.0, 35.0]
+        diameters = [2.0, 1.8, 2.2]  # mm
+        thread_pitches = [0.4, 0.35, 0.45]  # mm
+        
+        preloads = estimate_preload_from_torque_batch(torques, [d / 10 for d in diameters], self.k_factor)
+        tensile_areas = calculate_tensile_area_batch(diameters, thread_pitches)
+        stresses = calculate_stress_from_preload_batch(preloads, tensile_areas)
+        safety_factors = calculate_safety_factor_batch(stresses, self.yield_strength)
+        
+        for i, (torque, diameter, thread_pitch) in enumerate(zip(torques, diameters, thread_pitches)):
+            preload = estimate_preload_from_torque(torque, diameter / 10, self.k_factor)
+            tensile_area = calculate_tensile_area(diameter, thread_pitch)
+            stress = calculate_stress_from_preload(preload, tensile_area)
+            
+            self.assertAlmostEqual(preloads[i], preload, places=10)
+            self.assertAlmostEqual(tensile_areas[i], tensile_area, places=10)
+            self.assertAlmostEqual(stresses[i], stress, places=10)
+            self.assertAlmostEqual(
+                safety_factors[i],
+                calculate_safety_factor(stress, self.yield_strength),
+                places=10
+            )
+    
+    def test_batch_calculations_reuse_out_buffer(self):
+        """Test a Monte Carlo run that reuses one output buffer for every batch."""
+        rng = np.random.default_rng(0)
+        tensile_area = 2.0  # mm²
+        buffer = np.empty(100_000)
+        
+        for _ in range(10):
+            removal_torques = rng.uniform(25.0, 32.0, buffer.size)
+            
+            preloads = calculate_preload_batch(35.0, removal_torques, 0.04, out=buffer)
+            expected_preloads = calculate_preload_batch(35.0, removal_torques, 0.04)
+            np.testing.assert_allclose(preloads, expected_preloads, rtol=1e-12)
+            
+            stresses = calculate_stress_from_preload_batch(preloads, tensile_area, out=buffer)
+            safety_factors = calculate_safety_factor_batch(stresses, self.yield_strength, out=buffer)
+            
+            self.assertIs(safety_factors, buffer)
+            np.testing.assert_allclose(
+                safety_factors,
+                calculate_safety_factor_batch(expected_preloads / tensile_area, self.yield_strength),
+                rtol=1e-12
+            )
+        
+        conventional_preloads = estimate_preload_from_torque_batch(
+            [25.0, 35.0], 0.2, self.k_factor, out=buffer[:2]
+        )
+        np.testing.assert_allclose(
+            conventional_preloads, estimate_preload_from_torque_batch([25.0, 35.0], 0.2, self.k_factor)
+        )
+    
+    def test_batch_calculations_invalid_input(self):
+        """Test that the batch calculations reject invalid values."""
+        with self.assertRaises(ValueError):
+            estimate_preload_from_torque_batch([35, 35], [0.2, 0], self.k_factor)
+        
+        with self.assertRaises(ValueError):
+            calculate_stress_from_preload_batch([400, 400], [2.0, -1.0])
+        
+        with self.assertRaises(ValueError):
+            calculate_safety_factor_batch([200, 0], self.yield_strength)
+        
+        with self.assertRaises(ValueError):
+            calculate_tensile_area_batch([2.0, 2.0], [0.4, 0])
+    
+    def test_calculate_safety_factor_from_torques(self):
+        """Test that the fused calculation matches preload, stress and safety factor in turn."""
+        tightening_torques = [35.0, 25.0, 15.0]
+        removal_torques = [29.5, 21.4, 14.0]
+        tensile_area = 2.0  # mm²
+        
+        safety_factors = calculate_safety_factor_from_torques_batch(
+            tightening_torques, removal_torques, 0.04, tensile_area, self.yield_strength
+        )
+        
+        for i in range(len(tightening_torques)):
+            preload = calculate_preload(tightening_torques[i], removal_torques[i], 0.04)
+            stress = calculate_stress_from_preload(preload, tensile_area)
+            expected = calculate_safety_factor(stress, self.yield_strength)
+            
+            self.assertAlmostEqual(
+                calculate_safety_factor_from_torques(
+                    tightening_torques[i], removal_torques[i], 0.04, tensile_area, self.yield_strength
+                ),
+                expected,
+                places=10
+            )
+            self.assertAlmostEqual(safety_factors[i], expected, places=10)
+        
+        with self.assertRaises(ValueError):
+            calculate_safety_factor_from_torques(35.0, 35.0, 0.04, tensile_area, self.yield_strength)
+        
+        with self.assertRaises(ValueError):
+            calculate_safety_factor_from_torques(35.0, 29.5, 0.04, 0, self.yield_strength)
+        
+        with self.assertRaises(ValueError):
+            calculate_safety_factor_from_torques_batch([35.0, 35.0], [29.5, 29.5], [0.04, 0], 2.0, 950.0)
+    
+    def test_analyze_implants_batch(self):
+        """Test that the fused implant analysis matches the scalar functions for both methods."""
+        torques = [35.0, 25.0, 15.0]
+        diameters = [2.0, 1.8, 1.6]  # mm
+        thread_pitches = [0.4, 0.35, 0.3]  # mm
+        yield_strength = 950.0
+        removal_factor = 0.85
+        
+        analysis = analyze_implants_batch(
+            torques, diameters, thread_pitches, self.k_factor, yield_strength, removal_factor
+        )
+        
+        for i in range(len(torques)):
+            tensile_area = calculate_tensile_area(diameters[i], thread_pitches[i])
+            conventional_preload = estimate_preload_from_torque(torques[i], diameters[i] / 10, self.k_factor)
+            wh_preload = calculate_preload(torques[i], torques[i] * removal_factor, thread_pitches[i] / 10)
+            conventional_safety = calculate_safety_factor(
+                calculate_stress_from_preload(conventional_preload, tensile_area), yield_strength
+            )
+            wh_safety = calculate_safety_factor(
+                calculate_stress_from_preload(wh_preload, tensile_area), yield_strength
+            )
+            
+            self.assertAlmostEqual(analysis.conventional_preload[i], conventional_preload, places=8)
+            self.assertAlmostEqual(analysis.wh_preload[i], wh_preload, places=8)
+            self.assertAlmostEqual(analysis.conventional_safety_factor[i], conventional_safety, places=8)
+            self.assertAlmostEqual(analysis.wh_safety_factor[i], wh_safety, places=8)
+            self.assertEqual(
+                RISK_LEVELS[analysis.conventional_risk_code[i]], assess_risk(conventional_safety).level
+            )
+            self.assertEqual(RISK_LEVELS[analysis.wh_risk_code[i]], assess_risk(wh_safety).level)
+        
+        invalid_cases = [
+            dict(torque=[0.0, 35.0]),
+            dict(thread_pitch_mm=[0.4, 0.0]),
+            dict(k_factor=0.0),
+            dict(yield_strength=-950.0),
+            dict(diameter_mm=[2.0, 0.3]),  # Smaller than the thread depth
+            dict(removal_factor=1.0),
+            dict(min_safety_factor=0.0)
+        ]
+        for invalid in invalid_cases:
+            arguments = dict(
+                torque=[35.0, 25.0], diameter_mm=[2.0, 1.8], thread_pitch_mm=[0.4, 0.35],
+                k_factor=self.k_factor, yield_strength=yield_strength, removal_factor=removal_factor
+            )
+            arguments.update(invalid)
+            with self.subTest(**invalid), self.assertRaises(ValueError):
+                analyze_implants_batch(**arguments)
+    
+    def test_validate_positive(self):
+        """Test the one-off validation of positive scalars and arrays."""
+        validate_positive(thread_pitch=0.04, tensile_area=[2.0, 8.0], yield_strength=950)
+        
+        with self.assertRaisesRegex(ValueError, "tensile_area"):
+            validate_positive(thread_pitch=0.04, tensile_area=[2.0, 0.0])
+        
+        with self.assertRaises(ValueError):
+            validate_positive(yield_strength=-950)
+    
+    def test_assess_risk_returns_shared_results(self):
+        """Test that assess_risk returns one shared result per risk level rather than new tuples."""
+        for safety_factors in [(2.0, 2.5), (4.0, 5.0), (0.5, 1.0)]:
+            first, second = (assess_risk.__wrapped__(sf) for sf in safety_factors)
+            self.assertIs(first, second)
+            
+            first, second = (assess_risk.__wrapped__(sf, 1.2) for sf in safety_factors)
+            self.assertIs(first, second)
+    
+    def test_assess_risk_batch(self):
+        """Test that batch risk assessment matches assess_risk at the thresholds."""
+        safety_factors = [4.0, 3.0, 2.0, 1.5, 1.2, 0.0]
+        
+        risk_codes = assess_risk_batch(safety_factors)
+        
+        self.assertEqual(risk_codes.dtype.name, "int8")
+        for safety_factor, risk_code in zip(safety_factors, risk_codes):
+            self.assertEqual(RISK_LEVELS[risk_code], assess_risk(safety_factor).level)
+        
+        with self.assertRaises(ValueError):
+            assess_risk_batch([2.0, -1.0])
+    
+    def test_assess_risk_batch_nan(self):
+        """Test that an undefined safety factor is High risk in both the batch and scalar paths."""
+        risk_codes = assess_risk_batch([float("nan"), 4.0])
+        
+        self.assertEqual(RISK_LEVELS[risk_codes[0]], assess_risk(float("nan")).level)
+        self.assertEqual(RISK_LEVELS[risk_codes[0]], "High")
+        self.assertEqual(RISK_LEVELS[risk_codes[1]], "Low")
+        self.assertEqual(RISK_LEVELS[assess_risk_batch(float("nan"))], "High")
+        self.assertEqual(_kernels.risk_code_kernel(float("nan"), 1.5), risk_codes[0])
+    
+    def test_assess_risk_min_safety_factor(self):
+        """Test risk levels at the boundaries of a custom minimum safety factor."""
+        cases = [
+            (2.5, 2.0, "Medium"),
+            (2.0, 2.0, "Medium"),
+            (1.9, 2.0, "High"),
+            (3.0, 3.0, "Medium"),
+            (3.5, 4.0, "Low"),
+            (3.0, 4.0, "High")
+        ]
+        
+        for safety_factor, min_safety_factor, expected_level in cases:
+            self.assertEqual(assess_risk(safety_factor, min_safety_factor).level, expected_level)
+            self.assertEqual(
+                RISK_LEVELS[assess_risk_batch([safety_factor], min_safety_factor)[0]],
+                expected_level
+            )
+    
+    def test_calculate_torque_range_batch(self):
+        """Test that batch torque ranges match calculate_torque_range."""
+        nominal_torques = [15.0, 25.0, 35.0]
+        is_lubricated = [False, True, False]
+        
+        min_torques, max_torques = calculate_torque_range_batch(nominal_torques, is_lubricated)
+        
+        for i, nominal_torque in enumerate(nominal_torques):
+            min_torque, max_torque = calculate_torque_range(nominal_torque, is_lubricated[i])
+            self.assertAlmostEqual(min_torques[i], min_torque)
+            self.assertAlmostEqual(max_torques[i], max_torque)
+    
     def test_integrated_torque_stress_calculation(self):
         """Test the integrated calculation from torque to safety factor."""
         # Starting with a torque of 35 N-cm